@@ -4,6 +4,8 @@ Vox - AI-powered text rewriting through macOS contextual menu
 Main entry point for the application. Initializes both the menu bar app
 and the service provider registration.
 """
+import logging
+import os
 import sys
 import signal
 
@@ -13,6 +15,11 @@ from vox.service import ServiceProvider
 
 def main():
     """Main entry point for Vox application."""
+    # VOX_DEBUG=1 turns on debug logging from the vox modules
+    if os.environ.get("VOX_DEBUG"):
+        logging.basicConfig(format="%(asctime)s %(name)s: %(message)s")
+        logging.getLogger("vox").setLevel(logging.DEBUG)
+
     # Handle SIGTERM gracefully
     signal.signal(signal.SIGTERM, lambda sig, frame: sys.exit(0))
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 from vox.config import (
     Config,
+    HotkeyInfo,
     DEFAULT_CONFIG,
     DEFAULT_MODELS,
     get_config,
@@ -240,6 +241,37 @@ class TestConfigApiKey:
             assert temp_config.get_api_key() == "sk-test123"
             mock_keychain.get_password.assert_called_once()
 
+    def test_get_api_key_is_cached(self, temp_config, mock_keychain):
+        """Test repeated get_api_key calls read the keychain only once."""
+        mock_keychain.get_password.return_value = "sk-test123"
+        with patch("vox.config.KeychainManager", return_value=mock_keychain):
+            assert temp_config.get_api_key() == "sk-test123"
+            assert temp_config.get_api_key() == "sk-test123"
+            mock_keychain.get_password.assert_called_once()
+
+    def test_set_api_key_invalidates_cache(self, temp_config, mock_keychain):
+        """Test set_api_key makes the next get_api_key read the keychain."""
+        mock_keychain.get_password.return_value = "sk-old"
+        with patch("vox.config.KeychainManager", return_value=mock_keychain):
+            assert temp_config.get_api_key() == "sk-old"
+
+            temp_config.set_api_key("sk-new")
+            mock_keychain.get_password.return_value = "sk-new"
+
+            assert temp_config.get_api_key() == "sk-new"
+            assert mock_keychain.get_password.call_count == 2
+
+    def test_delete_api_key_invalidates_cache(self, temp_config, mock_keychain):
+        """Test delete_api_key clears the cached key."""
+        mock_keychain.get_password.return_value = "sk-old"
+        with patch("vox.config.KeychainManager", return_value=mock_keychain):
+            assert temp_config.get_api_key() == "sk-old"
+
+            temp_config.delete_api_key()
+            mock_keychain.get_password.return_value = None
+
+            assert temp_config.get_api_key() is None
+
     def test_set_api_key(self, temp_config, mock_keychain):
         """Test setting API key stores in keychain."""
         with patch("vox.config.KeychainManager", return_value=mock_keychain):
@@ -653,6 +685,134 @@ class TestConfigHotkey:
         assert temp_config.hotkeys_enabled is False
 
 
+class TestConfigParsedHotkeys:
+    """Tests for the cached, parsed hot key table."""
+
+    @pytest.fixture
+    def temp_config(self):
+        """Create a config instance for parsed hot key tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("vox.config.Path.home", return_value=Path(tmpdir)):
+                reset_config()
+                config = Config()
+                yield config
+
+    @pytest.fixture
+    def mock_hotkey_module(self):
+        """Stand in for vox.hotkey, which needs Quartz."""
+        module = MagicMock()
+        module.parse_modifiers.side_effect = lambda mods: len(mods)
+        module.format_hotkey_display.side_effect = lambda mask, key: f"{mask}:{key.upper()}"
+        with patch.dict("sys.modules", {"vox.hotkey": module}):
+            yield module
+
+    def test_parsed_hotkeys_values(self, temp_config, mock_hotkey_module):
+        """Test each mode is parsed into a HotkeyInfo."""
+        parsed = temp_config.get_parsed_hotkeys()
+        assert parsed["fix_grammar"] == HotkeyInfo(len("cmd+shift"), "g", "9:G")
+        assert set(parsed) == set(DEFAULT_CONFIG["hotkeys"])
+
+    def test_parsed_hotkeys_cached(self, temp_config, mock_hotkey_module):
+        """Test modifier strings are parsed only once."""
+        first = temp_config.get_parsed_hotkeys()
+        calls = mock_hotkey_module.parse_modifiers.call_count
+        assert temp_config.get_parsed_hotkeys() is first
+        assert mock_hotkey_module.parse_modifiers.call_count == calls
+
+    def test_parsed_hotkeys_unassigned(self, temp_config, mock_hotkey_module):
+        """Test a cleared shortcut has an empty display string."""
+        temp_config.set_mode_hotkey("concise", "cmd", "")
+        assert temp_config.get_parsed_hotkeys()["concise"].display == ""
+
+    def test_set_mode_hotkey_invalidates_cache(self, temp_config, mock_hotkey_module):
+        """Test set_mode_hotkey drops the cached table."""
+        temp_config.get_parsed_hotkeys()
+        temp_config.set_mode_hotkey("fix_grammar", "option", "r")
+        assert temp_config.get_parsed_hotkeys()["fix_grammar"].key == "r"
+
+    def test_load_invalidates_cache(self, temp_config, mock_hotkey_module):
+        """Test reloading the config drops the cached table."""
+        first = temp_config.get_parsed_hotkeys()
+        temp_config.load()
+        assert temp_config.get_parsed_hotkeys() is not first
+
+
+class TestConfigBatch:
+    """Tests for grouping config writes."""
+
+    @pytest.fixture
+    def temp_config(self):
+        """Create a config instance for batch tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("vox.config.Path.home", return_value=Path(tmpdir)):
+                reset_config()
+                config = Config()
+                yield config
+
+    def test_batch_writes_once(self, temp_config):
+        """Test setters inside batch() write the file once on exit."""
+        with patch("vox.config.yaml.dump") as mock_dump:
+            with temp_config.batch():
+                temp_config.model = "gpt-4o"
+                temp_config.thinking_mode = True
+                temp_config.set_mode_hotkey("fix_grammar", "option", "r")
+                mock_dump.assert_not_called()
+            mock_dump.assert_called_once()
+
+    def test_batch_updates_values_immediately(self, temp_config):
+        """Test values set inside batch() are readable before exit."""
+        with temp_config.batch():
+            temp_config.model = "gpt-4o"
+            assert temp_config.model == "gpt-4o"
+
+    def test_batch_persists_on_exit(self, temp_config):
+        """Test batched values are saved to disk."""
+        with temp_config.batch():
+            temp_config.model = "gpt-4o"
+            temp_config.hotkeys_enabled = False
+
+        temp_config.load()
+        assert temp_config.model == "gpt-4o"
+        assert temp_config.hotkeys_enabled is False
+
+    def test_nested_batch_writes_on_outer_exit(self, temp_config):
+        """Test nested batches only write when the outermost one exits."""
+        with patch("vox.config.yaml.dump") as mock_dump:
+            with temp_config.batch():
+                with temp_config.batch():
+                    temp_config.model = "gpt-4o"
+                mock_dump.assert_not_called()
+            mock_dump.assert_called_once()
+
+    def test_batch_without_changes_does_not_write(self, temp_config):
+        """Test an empty batch does not touch the file."""
+        with patch("vox.config.yaml.dump") as mock_dump:
+            with temp_config.batch():
+                pass
+            mock_dump.assert_not_called()
+
+    def test_set_all_mode_hotkeys(self, temp_config):
+        """Test set_all_mode_hotkeys updates several modes with one write."""
+        with patch("vox.config.yaml.dump") as mock_dump:
+            changed = temp_config.set_all_mode_hotkeys({
+                "fix_grammar": {"modifiers": "option", "key": "R"},
+                "concise": {"modifiers": "cmd", "key": ""},
+            })
+            mock_dump.assert_called_once()
+
+        assert changed is True
+        assert temp_config.get_mode_hotkey("fix_grammar") == {"modifiers": "option", "key": "r"}
+        assert temp_config.get_mode_hotkey("concise") == {"modifiers": "cmd", "key": ""}
+
+    def test_set_all_mode_hotkeys_unchanged(self, temp_config):
+        """Test set_all_mode_hotkeys skips the write when nothing changed."""
+        with patch("vox.config.yaml.dump") as mock_dump:
+            changed = temp_config.set_all_mode_hotkeys(temp_config.get_all_hotkeys())
+            mock_dump.assert_not_called()
+
+        assert changed is False
+
+
 class TestConfigAutoStart:
     """Tests for auto-start Launch Agent management."""
 
@@ -233,6 +233,31 @@ class TestHotKeyManager:
         assert manager._hotkey_targets[1][0] == KEY_CODES['p']
         assert manager._hotkey_targets[1][2] == RewriteMode.PROFESSIONAL
 
+    def test_update_hotkeys(self):
+        """Test updating some modes keeps the other targets."""
+        manager = HotKeyManager()
+        manager.set_hotkeys([
+            ("cmd+shift", "g", RewriteMode.FIX_GRAMMAR),
+            ("cmd+shift", "p", RewriteMode.PROFESSIONAL),
+        ])
+        manager.update_hotkeys([("option", "r", RewriteMode.FIX_GRAMMAR)])
+
+        targets = {mode: (key_code, mask) for key_code, mask, mode in manager._hotkey_targets}
+        assert targets[RewriteMode.FIX_GRAMMAR] == (KEY_CODES['r'], kCGEventFlagMaskAlternate)
+        assert targets[RewriteMode.PROFESSIONAL][0] == KEY_CODES['p']
+
+    def test_update_hotkeys_empty_key_removes(self):
+        """Test updating a mode with an empty key removes its target."""
+        manager = HotKeyManager()
+        manager.set_hotkeys([
+            ("cmd+shift", "g", RewriteMode.FIX_GRAMMAR),
+            ("cmd+shift", "p", RewriteMode.PROFESSIONAL),
+        ])
+        manager.update_hotkeys([("cmd+shift", "", RewriteMode.FIX_GRAMMAR)])
+
+        assert len(manager._hotkey_targets) == 1
+        assert manager._hotkey_targets[0][2] == RewriteMode.PROFESSIONAL
+
     def test_set_enabled_true(self):
         """Test enabling the hot key manager."""
         manager = HotKeyManager()
@@ -0,0 +1,102 @@
+"""Tests for the service module."""
+from unittest.mock import patch, MagicMock
+
+import AppKit
+import pytest
+
+from vox.api import RewriteMode
+from vox.service import ServiceProvider
+
+
+class TestServiceProviderReload:
+    """Tests for ServiceProvider.reload and lazy client creation."""
+
+    def test_reload_resets_client(self):
+        """Test reload drops the cached client without building a new one."""
+        provider = ServiceProvider.alloc().init()
+        provider._api_client = MagicMock()
+
+        with patch("vox.service.RewriteAPI") as mock_api:
+            provider.reload()
+
+            assert provider._api_client is None
+            mock_api.assert_not_called()
+
+    def test_client_rebuilt_lazily_once_after_reload(self):
+        """Test the next use after reload builds exactly one client."""
+        provider = ServiceProvider.alloc().init()
+        provider._api_client = MagicMock()
+        mock_config = MagicMock()
+        mock_config.get_api_key.return_value = "sk-new"
+        mock_config.model = "gpt-4o"
+        mock_config.base_url = None
+
+        with patch("vox.service.get_config", return_value=mock_config), \
+                patch("vox.service.RewriteAPI") as mock_api:
+            provider.reload()
+
+            first = provider._get_api_client()
+            second = provider._get_api_client()
+
+            assert first is second is mock_api.return_value
+            mock_api.assert_called_once_with("sk-new", "gpt-4o", None)
+
+
+class TestServiceProviderBackgroundCalls:
+    """Tests for ServiceProvider._call_in_background and shutdown."""
+
+    def test_returns_result_of_background_call(self):
+        """Test the worker's return value is handed back to the caller."""
+        provider = ServiceProvider.alloc().init()
+
+        assert provider._call_in_background(lambda a, b: a + b, 2, 3) == 5
+
+    def test_reraises_background_exception(self):
+        """Test an exception on the worker is re-raised on the caller."""
+        provider = ServiceProvider.alloc().init()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            provider._call_in_background(fail)
+
+    def test_waits_in_default_run_loop_mode(self):
+        """Test the wait keeps running the default run loop mode."""
+        provider = ServiceProvider.alloc().init()
+        run_loop = MagicMock()
+
+        def slow():
+            # Give the main thread a chance to spin the run loop
+            while not run_loop.runMode_beforeDate_.called:
+                pass
+
+        with patch("vox.service.AppKit.NSRunLoop") as mock_run_loop:
+            mock_run_loop.currentRunLoop.return_value = run_loop
+            provider._call_in_background(slow)
+
+        modes = {call.args[0] for call in run_loop.runMode_beforeDate_.call_args_list}
+        assert modes == {AppKit.NSDefaultRunLoopMode}
+        assert provider._in_service_call is False
+
+    def test_nested_service_call_is_ignored(self):
+        """Test a service call arriving during another one's wait is dropped."""
+        provider = ServiceProvider.alloc().init()
+        provider._in_service_call = True
+        pasteboard = MagicMock()
+
+        with patch.object(provider, "_get_api_client") as mock_client:
+            provider._handle_service(pasteboard, RewriteMode.IMPROVE)
+            provider._handle_custom_service(pasteboard)
+
+            mock_client.assert_not_called()
+        pasteboard.readObjectsForClasses_options_.assert_not_called()
+
+    def test_shutdown_stops_worker(self):
+        """Test shutdown stops the worker from accepting new calls."""
+        provider = ServiceProvider.alloc().init()
+
+        provider.shutdown()
+
+        with pytest.raises(RuntimeError):
+            provider._worker.submit(lambda: None)
@@ -0,0 +1,192 @@
+"""Tests for the menu bar app module."""
+from unittest.mock import MagicMock, patch
+
+from vox import ui
+from vox.api import RewriteMode
+from vox.ui import MenuBarApp, get_selected_text, paste_text
+
+
+# Speech hotkey held by the test config; copy it wherever a dict is passed
+SPEECH_HOTKEY = {"modifiers": "cmd", "key": ""}
+
+
+class TestSaveSettingsHotkeyRegistration:
+    """Tests for hot key tap registration in MenuBarApp._save_settings."""
+
+    def _make_app(self, registered: bool) -> MenuBarApp:
+        """Create a MenuBarApp whose config matches the saved values below."""
+        app = MenuBarApp.__new__(MenuBarApp)
+
+        config = MagicMock()
+        config.get_api_key.return_value = "sk-test"
+        config.model = "gpt-4o-mini"
+        config.base_url = None
+        config.auto_start = False
+        config.thinking_mode = False
+        config.hotkeys_enabled = True
+        config.get_all_hotkeys.return_value = {}
+        config.speech_enabled = False
+        config.speech_model = "base"
+        config.speech_language = "auto"
+        config.get_speech_hotkey.return_value = dict(SPEECH_HOTKEY)
+        app.config = config
+
+        app.service_provider = MagicMock()
+        app._api_client = None
+        app._hotkey_manager = MagicMock()
+        app._hotkey_manager.is_registered.return_value = registered
+        app._last_hotkey_configs = [("", "", mode) for mode in RewriteMode]
+        return app
+
+    def _save_unchanged(self, app: MenuBarApp):
+        """Save the same settings the app's config already holds."""
+        app._save_settings(
+            "sk-test", "gpt-4o-mini", None, False,
+            True, {},
+            speech_enabled=False, speech_model="base",
+            speech_language="auto", speech_hotkey=dict(SPEECH_HOTKEY),
+            thinking_mode=False,
+        )
+
+    def test_save_registers_missing_tap(self):
+        """Test Save retries installing the tap when none is registered."""
+        app = self._make_app(registered=False)
+
+        self._save_unchanged(app)
+
+        app._hotkey_manager.register_hotkey.assert_called_once()
+        app._hotkey_manager.reregister_hotkey.assert_not_called()
+
+    def test_save_keeps_installed_tap_when_unchanged(self):
+        """Test Save leaves an installed tap alone when nothing changed."""
+        app = self._make_app(registered=True)
+
+        self._save_unchanged(app)
+
+        app._hotkey_manager.register_hotkey.assert_not_called()
+        app._hotkey_manager.reregister_hotkey.assert_not_called()
+
+
+def _frontmost(bundle_id):
+    """Patch the workspace so the frontmost app has bundle_id."""
+    workspace = MagicMock()
+    workspace.frontmostApplication.return_value.bundleIdentifier.return_value = bundle_id
+    return patch("vox.ui._WORKSPACE", workspace)
+
+
+class TestPasteText:
+    """Tests for choosing between the Accessibility write and Cmd+V."""
+
+    def test_unlisted_app_uses_cmd_v(self):
+        """Test apps outside the allowlist never get the Accessibility write."""
+        with _frontmost("com.google.Chrome"), \
+                patch("vox.ui._replace_selection_via_ax") as mock_ax, \
+                patch("vox.ui._PASTEBOARD") as mock_pb, \
+                patch("vox.ui._post_cmd_key") as mock_post:
+            paste_text("hello")
+
+            mock_ax.assert_not_called()
+            mock_pb.setString_forType_.assert_called_once_with("hello", ui._PBTYPE)
+            mock_post.assert_called_once_with(ui._KEY_V)
+
+    def test_allowlisted_app_skips_cmd_v_after_write(self):
+        """Test a verified Accessibility write isn't followed by Cmd+V."""
+        with _frontmost("com.apple.TextEdit"), \
+                patch("vox.ui._replace_selection_via_ax", return_value=True), \
+                patch("vox.ui._post_cmd_key") as mock_post:
+            paste_text("hello")
+
+            mock_post.assert_not_called()
+
+    def test_allowlisted_app_falls_back_to_cmd_v(self):
+        """Test Cmd+V is used when the Accessibility write inserted nothing."""
+        with _frontmost("com.apple.TextEdit"), \
+                patch("vox.ui._replace_selection_via_ax", return_value=False), \
+                patch("vox.ui._PASTEBOARD"), \
+                patch("vox.ui._post_cmd_key") as mock_post:
+            paste_text("hello")
+
+            mock_post.assert_called_once_with(ui._KEY_V)
+
+
+class TestReplaceSelectionViaAX:
+    """Tests for the read-back check in _replace_selection_via_ax."""
+
+    def _replace(self, values, err=None):
+        """Run the write with the focused element's value reading as values."""
+        focused = MagicMock()
+        reads = iter(values)
+
+        def copy_attribute(element, attribute):
+            if attribute == ui.kAXFocusedUIElementAttribute:
+                return focused
+            return next(reads)
+
+        if err is None:
+            err = ui.kAXErrorSuccess
+        with patch("vox.ui._copy_ax_attribute", side_effect=copy_attribute), \
+                patch("vox.ui.AXUIElementSetAttributeValue", return_value=err):
+            return ui._replace_selection_via_ax("new")
+
+    def test_changed_value_is_success(self):
+        """Test a write that changed the value is accepted."""
+        assert self._replace(["old text", "new text"]) is True
+
+    def test_unchanged_value_is_failure(self):
+        """Test a write reported as successful but not applied is rejected."""
+        assert self._replace(["old text", "old text"]) is False
+
+    def test_error_code_is_failure(self):
+        """Test a write that returned an error is rejected."""
+        assert self._replace(["old text"], err=ui.kAXErrorSuccess + 1) is False
+
+
+class TestGetSelectedTextAXCache:
+    """Tests for remembering apps without Accessibility selection support."""
+
+    def test_none_bundle_id_not_cached(self):
+        """Test a failed read with no bundle ID doesn't mark None unsupported."""
+        with _frontmost(None), \
+                patch("vox.ui._get_selected_text_via_ax", return_value=None), \
+                patch("vox.ui._AX_UNSUPPORTED_APPS", set()) as unsupported, \
+                patch("vox.ui._PASTEBOARD"), \
+                patch("vox.ui._post_cmd_key"), \
+                patch("vox.ui._COPY_TIMEOUT", 0):
+            get_selected_text()
+
+            assert None not in unsupported
+
+
+class TestSnapshotPasteboard:
+    """Tests for saving the clipboard before a simulated Cmd+C."""
+
+    def test_reads_only_string_type(self):
+        """Test only the string type is read, never every item's data."""
+        pasteboard = MagicMock()
+        pasteboard.stringForType_.return_value = "saved"
+
+        with patch("vox.ui._CLIPBOARD_SNAPSHOT", (None, None)):
+            assert ui._snapshot_pasteboard(pasteboard, 5) == "saved"
+
+        pasteboard.stringForType_.assert_called_once_with(ui._PBTYPE)
+        pasteboard.pasteboardItems.assert_not_called()
+
+    def test_reuses_restored_text_while_unchanged(self):
+        """Test the last restored text is reused while the change count matches."""
+        pasteboard = MagicMock()
+
+        with patch("vox.ui._CLIPBOARD_SNAPSHOT", (7, "restored")):
+            assert ui._snapshot_pasteboard(pasteboard, 7) == "restored"
+
+        pasteboard.stringForType_.assert_not_called()
+
+    def test_restore_records_change_count(self):
+        """Test a restore remembers the change count it left behind."""
+        pasteboard = MagicMock()
+        pasteboard.changeCount.return_value = 9
+
+        with patch("vox.ui._CLIPBOARD_SNAPSHOT", (None, None)):
+            ui._restore_pasteboard(pasteboard, "saved")
+
+            assert ui._CLIPBOARD_SNAPSHOT == (9, "saved")
+        pasteboard.setString_forType_.assert_called_once_with("saved", ui._PBTYPE)
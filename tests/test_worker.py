@@ -0,0 +1,77 @@
+"""Tests for the worker module."""
+import threading
+
+import pytest
+from vox.worker import SerialWorker
+
+
+class TestSerialWorker:
+    """Tests for SerialWorker."""
+
+    def test_returns_result(self):
+        """Test a submitted call's result is set on its future."""
+        worker = SerialWorker("TestWorker")
+
+        assert worker.submit(lambda a, b: a + b, 2, 3).result(timeout=5) == 5
+
+    def test_sets_exception(self):
+        """Test an exception from a call is set on its future."""
+        worker = SerialWorker("TestWorker")
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            worker.submit(fail).result(timeout=5)
+
+    def test_runs_calls_in_order_on_one_thread(self):
+        """Test calls run in submission order on a single thread."""
+        worker = SerialWorker("TestWorker")
+        calls = []
+
+        futures = [
+            worker.submit(lambda i=i: calls.append((i, threading.current_thread().name)))
+            for i in range(5)
+        ]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert [i for i, _ in calls] == [0, 1, 2, 3, 4]
+        assert {name for _, name in calls} == {"TestWorker"}
+
+    def test_thread_is_daemon(self):
+        """Test the worker thread doesn't hold up interpreter exit."""
+        worker = SerialWorker("TestWorker")
+
+        assert worker._thread.daemon is True
+
+    def test_shutdown_cancels_queued_calls(self):
+        """Test shutdown cancels calls still waiting behind a running one."""
+        worker = SerialWorker("TestWorker")
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        running = worker.submit(block)
+        started.wait(5)
+        queued = worker.submit(lambda: None)
+
+        worker.shutdown()
+        release.set()
+
+        assert queued.cancelled()
+        assert running.result(timeout=5) is None
+        worker._thread.join(5)
+        assert not worker._thread.is_alive()
+
+    def test_submit_after_shutdown_raises(self):
+        """Test the worker refuses new calls after shutdown."""
+        worker = SerialWorker("TestWorker")
+
+        worker.shutdown()
+
+        with pytest.raises(RuntimeError):
+            worker.submit(lambda: None)
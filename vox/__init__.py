@@ -2,4 +2,10 @@
 Vox - AI-powered text rewriting through macOS contextual menu
 """
 
+import logging
+
 __version__ = "0.1.0"
+
+# Library modules log through "vox.*" loggers; main.py attaches a handler
+# when VOX_DEBUG is set, otherwise debug output is dropped
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -5,8 +5,9 @@ Handles loading/saving configuration from config.yml and storing
 the API key securely in the macOS Keychain.
 """
 import yaml
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from vox.keychain import KeychainManager, KeychainError
 
@@ -37,6 +38,14 @@ DEFAULT_CONFIG = {
 }
 
 
+class HotkeyInfo(NamedTuple):
+    """A mode hotkey with its modifier string already parsed."""
+
+    mask: int  # Combined CGEvent modifier flags
+    key: str  # Key character, "" when unassigned
+    display: str  # Symbol string like "⌘⇧G", "" when unassigned
+
+
 class Config:
     """Manages Vox configuration and secure API key storage."""
 
@@ -45,6 +54,11 @@ class Config:
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "config.yml"
         self._config = {}
+        self._hotkey_cache: Optional[dict] = None
+        # Last key read from the keychain; cleared whenever the key is written
+        self._cached_api_key: Optional[str] = None
+        self._batch_depth = 0
+        self._save_pending = False
         self._ensure_config_dir()
         self.load()
 
@@ -61,6 +75,7 @@ class Config:
 
     def load(self):
         """Load configuration from file, merging with defaults."""
+        self._hotkey_cache = None
         self._config = DEFAULT_CONFIG.copy()
         # Deep-copy the hotkeys dict so mutations don't affect DEFAULT_CONFIG
         self._config["hotkeys"] = {
@@ -108,7 +123,10 @@ class Config:
                 print(f"Warning: Could not load config: {e}")
 
     def save(self):
-        """Save current configuration to file."""
+        """Save current configuration to file (deferred inside batch())."""
+        if self._batch_depth:
+            self._save_pending = True
+            return
         try:
             # Create a copy of config without api_key to prevent plaintext storage
             config_to_save = {k: v for k, v in self._config.items() if k != "api_key"}
@@ -117,6 +135,22 @@ class Config:
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    @contextmanager
+    def batch(self):
+        """Group several setter calls into a single write of the config file.
+
+        Setters called inside the block update the in-memory config as usual;
+        the file is written once when the outermost block exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self._save_pending = False
+                self.save()
+
     @property
     def model(self) -> str:
         """Get the configured OpenAI model."""
@@ -215,8 +249,28 @@ class Config:
             "modifiers": modifiers,
             "key": key.lower() if key else "",
         }
+        self._hotkey_cache = None
         self.save()
 
+    def set_all_mode_hotkeys(self, hotkey_configs: dict) -> bool:
+        """Set the hotkeys for several modes with a single write.
+
+        Args:
+            hotkey_configs: Dict mapping mode_value -> {"modifiers": str, "key": str}.
+
+        Returns:
+            True if any hotkey changed, False if all were already set.
+        """
+        current = self.get_all_hotkeys()
+        changed = False
+        with self.batch():
+            for mode_value, hk in hotkey_configs.items():
+                key = hk["key"].lower() if hk["key"] else ""
+                if current.get(mode_value) != {"modifiers": hk["modifiers"], "key": key}:
+                    self.set_mode_hotkey(mode_value, hk["modifiers"], key)
+                    changed = True
+        return changed
+
     def get_all_hotkeys(self) -> dict:
         """Get all hotkey configs, merging defaults with stored values.
 
@@ -230,6 +284,28 @@ class Config:
                 defaults[mode_key] = dict(hk)
         return defaults
 
+    def get_parsed_hotkeys(self) -> dict:
+        """Get all hotkey configs with their modifiers parsed.
+
+        The result is cached until a mode hotkey is changed or the config is
+        reloaded, so callers must not mutate it.
+
+        Returns:
+            Dict mapping mode_value -> HotkeyInfo(mask, key, display).
+        """
+        if self._hotkey_cache is None:
+            # Imported here because vox.hotkey pulls in Quartz
+            from vox.hotkey import format_hotkey_display, parse_modifiers
+
+            cache = {}
+            for mode_key, hk in self.get_all_hotkeys().items():
+                key = hk["key"]
+                mask = parse_modifiers(hk["modifiers"])
+                display = format_hotkey_display(mask, key) if key else ""
+                cache[mode_key] = HotkeyInfo(mask, key, display)
+            self._hotkey_cache = cache
+        return self._hotkey_cache
+
     # Speech-to-Text Settings
 
     @property
@@ -317,13 +393,19 @@ class Config:
 
         Checks keychain first. If no key exists in keychain, falls back to
         config file for migration and automatically migrates the key to keychain.
+        A key found in the keychain is cached, so later calls skip the
+        keychain lookup until the key is set or deleted.
 
         Returns:
             The API key string if found, None otherwise.
         """
+        if self._cached_api_key:
+            return self._cached_api_key
+
         # First check keychain
         keychain_key = self.get_api_key_from_keychain()
         if keychain_key:
+            self._cached_api_key = keychain_key
             return keychain_key
 
         # Fall back to config file for migration
@@ -379,6 +461,7 @@ class Config:
         Returns:
             True if successful, False otherwise.
         """
+        self._cached_api_key = None
         try:
             keychain = KeychainManager()
             return keychain.set_password(api_key)
@@ -391,6 +474,7 @@ class Config:
         Returns:
             True if successful, False otherwise.
         """
+        self._cached_api_key = None
         try:
             keychain = KeychainManager()
             return keychain.delete_password()
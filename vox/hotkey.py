@@ -4,6 +4,7 @@ Global hot key handling for Vox using Quartz CGEventTap.
 Uses CGEventTapCreate on a dedicated background thread with its own CFRunLoop,
 matching the proven pattern used by pynput's macOS keyboard listener.
 """
+import logging
 import threading
 from typing import Callable, Optional, Tuple
 
@@ -16,6 +17,8 @@ from ApplicationServices import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 # CGEvent modifier flag constants
 kCGEventFlagMaskCommand = Quartz.kCGEventFlagMaskCommand
 kCGEventFlagMaskAlternate = Quartz.kCGEventFlagMaskAlternate
@@ -200,13 +203,32 @@ class HotKeyManager:
             configs: List of (modifiers_str, key_str, mode) tuples.
                      Entries with empty key_str are skipped.
         """
-        self._hotkey_targets = []
+        # Build the new list before swapping it in; the tap thread reads it live
+        self._hotkey_targets = self._parse_targets(configs)
+
+    def update_hotkeys(self, configs):
+        """Replace the hotkey targets of the given modes, keeping the others.
+
+        Args:
+            configs: List of (modifiers_str, key_str, mode) tuples.
+                     An empty key_str removes that mode's hotkey.
+        """
+        modes = {mode for _, _, mode in configs}
+        targets = [target for target in self._hotkey_targets if target[2] not in modes]
+        targets.extend(self._parse_targets(configs))
+        self._hotkey_targets = targets
+
+    @staticmethod
+    def _parse_targets(configs):
+        """Parse (modifiers_str, key_str, mode) tuples into hotkey targets."""
+        targets = []
         for modifiers_str, key_str, mode in configs:
             if not key_str:
                 continue
             key_code = get_key_code(key_str)
             mod_mask = parse_modifiers(modifiers_str)
-            self._hotkey_targets.append((key_code, mod_mask, mode))
+            targets.append((key_code, mod_mask, mode))
+        return targets
 
     def set_speech_hotkey(self, modifiers_str: str, key_str: str, callback):
         """Set the speech hotkey with press-and-hold callback.
@@ -399,7 +421,7 @@ class HotKeyManager:
 
                         if now_pressed and not was_pressed and not self._speech_key_pressed and self._enabled:
                             self._speech_key_pressed = True
-                            print("Speech hotkey (modifier-only) pressed", flush=True)
+                            logger.debug("Speech hotkey (modifier-only) pressed")
                             callback = self._speech_callback
                             if callback:
                                 AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
@@ -407,7 +429,7 @@ class HotKeyManager:
                                 )
                         elif not now_pressed and was_pressed and self._speech_key_pressed:
                             self._speech_key_pressed = False
-                            print("Speech hotkey (modifier-only) released", flush=True)
+                            logger.debug("Speech hotkey (modifier-only) released")
                             callback = self._speech_callback
                             if callback:
                                 AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
@@ -433,7 +455,7 @@ class HotKeyManager:
 
                             if not self._speech_key_pressed and self._enabled:
                                 self._speech_key_pressed = True
-                                print("Speech hotkey pressed", flush=True)
+                                logger.debug("Speech hotkey pressed")
                                 # Capture callback by value to avoid race condition
                                 callback = self._speech_callback
                                 if callback:
@@ -445,7 +467,7 @@ class HotKeyManager:
                         elif event_type == Quartz.kCGEventKeyUp:
                             if self._speech_key_pressed:
                                 self._speech_key_pressed = False
-                                print("Speech hotkey released", flush=True)
+                                logger.debug("Speech hotkey released")
                                 # Capture callback by value to avoid race condition
                                 callback = self._speech_callback
                                 if callback:
@@ -465,17 +487,16 @@ class HotKeyManager:
             if autorepeat:
                 return event
 
-            # Check modifier flags
-            flags = Quartz.CGEventGetFlags(event)
-            relevant_flags = flags & ALL_MODIFIER_FLAGS_MASK
-
-            # Check against all registered hotkey targets
+            # Check against all registered hotkey targets (relevant_flags was
+            # read once at the top; targets hold pre-parsed key codes and masks)
             for target_key_code, target_modifiers, mode in self._hotkey_targets:
                 # Use subset check (all required modifiers must be present, ignore extras like CapsLock)
                 if keycode == target_key_code and (relevant_flags & target_modifiers) == target_modifiers:
                     if self._enabled and self._callback:
-                        key_char = KEY_CODE_TO_CHAR.get(keycode, "?")
-                        print(f"Hot key triggered: {mode.value} ({key_char})", flush=True)
+                        logger.debug(
+                            "Hot key triggered: %s (%s)",
+                            mode.value, KEY_CODE_TO_CHAR.get(keycode, "?"),
+                        )
                         # Capture mode in lambda default arg to avoid closure issues
                         AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
                             lambda m=mode: self._callback(m)
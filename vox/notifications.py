@@ -5,6 +5,7 @@ Provides toast popups near the cursor for loading state,
 a top-of-screen loading bar with shimmer animation,
 and macOS notification banners for errors.
 """
+import logging
 import objc
 import AppKit
 import Foundation
@@ -12,6 +13,9 @@ import Quartz
 from typing import Optional
 
 
+logger = logging.getLogger(__name__)
+
+
 class ToastWindow(AppKit.NSWindow):
     """A small toast popup window that appears near the cursor."""
 
@@ -191,6 +195,8 @@ class LoadingBar(AppKit.NSWindow):
     """
 
     _instance = None
+    # Shimmer animation, built once; Core Animation copies it on every add
+    _shimmer_animation = None
 
     BAR_WIDTH = 160
     BAR_HEIGHT = 5
@@ -280,11 +286,11 @@ class LoadingBar(AppKit.NSWindow):
 
     # -- animation -----------------------------------------------------------
 
-    def _start_animation(self):
-        """Start the repeating shimmer sweep."""
-        gradient = getattr(self, '_gradient', None)
-        if gradient is None:
-            return
+    @classmethod
+    def _shimmer(cls):
+        """Get the shimmer sweep animation, creating it on first use."""
+        if cls._shimmer_animation is not None:
+            return cls._shimmer_animation
 
         anim = Quartz.CABasicAnimation.animationWithKeyPath_("locations")
         # Sweep: concentrated highlight moves left → right
@@ -297,7 +303,19 @@ class LoadingBar(AppKit.NSWindow):
                 Quartz.kCAMediaTimingFunctionEaseInEaseOut
             )
         )
-        gradient.addAnimation_forKey_(anim, "shimmer")
+        cls._shimmer_animation = anim
+        return anim
+
+    def _start_animation(self):
+        """Start the repeating shimmer sweep.
+
+        The sweep runs entirely in Core Animation, so no timer wakes the
+        main run loop while the bar is visible.
+        """
+        gradient = getattr(self, '_gradient', None)
+        if gradient is None:
+            return
+        gradient.addAnimation_forKey_(self._shimmer(), "shimmer")
 
     def _stop_animation(self):
         """Stop the shimmer animation."""
@@ -359,6 +377,8 @@ class RecordingToast(AppKit.NSWindow):
     """A toast window showing recording status with audio level indicator."""
 
     _instance = None
+    # Pulse animation, built once; Core Animation copies it on every add
+    _pulse_animation = None
     _level_view = objc.ivar()
     _text_field = objc.ivar()
     _fill_view = objc.ivar()
@@ -460,15 +480,12 @@ class RecordingToast(AppKit.NSWindow):
 
         return window
 
-    def _start_pulse_animation(self):
-        """Start the pulsing animation for the recording indicator."""
-        if self._pulse_layer is None:
-            return
-
-        # Remove existing animation
-        self._pulse_layer.removeAnimationForKey_("pulse")
+    @classmethod
+    def _pulse(cls):
+        """Get the recording indicator pulse animation, creating it on first use."""
+        if cls._pulse_animation is not None:
+            return cls._pulse_animation
 
-        # Create pulse animation
         anim = Quartz.CABasicAnimation.animationWithKeyPath_("opacity")
         anim.setFromValue_(1.0)
         anim.setToValue_(0.3)
@@ -480,7 +497,17 @@ class RecordingToast(AppKit.NSWindow):
                 Quartz.kCAMediaTimingFunctionEaseInEaseOut
             )
         )
-        self._pulse_layer.addAnimation_forKey_(anim, "pulse")
+        cls._pulse_animation = anim
+        return anim
+
+    def _start_pulse_animation(self):
+        """Start the pulsing animation for the recording indicator."""
+        if self._pulse_layer is None:
+            return
+
+        # Remove existing animation
+        self._pulse_layer.removeAnimationForKey_("pulse")
+        self._pulse_layer.addAnimation_forKey_(self._pulse(), "pulse")
 
     def _stop_pulse_animation(self):
         """Stop the pulsing animation."""
@@ -501,7 +528,7 @@ class RecordingToast(AppKit.NSWindow):
         self.orderFrontRegardless()
         self._reset_level()
         self._start_pulse_animation()
-        print("Recording toast shown", flush=True)
+        logger.debug("Recording toast shown")
 
     def update_level(self, level: float):
         """Update the audio level indicator (0.0-1.0)."""
@@ -549,7 +576,7 @@ class RecordingToast(AppKit.NSWindow):
         """Hide the toast window."""
         self._stop_pulse_animation()
         self.orderOut_(None)
-        print("Recording toast hidden", flush=True)
+        logger.debug("Recording toast hidden")
 
     @classmethod
     def get_instance(cls):
@@ -12,6 +12,7 @@ from typing import Optional, Callable
 from vox.config import get_config
 from vox.api import RewriteMode, DISPLAY_NAMES
 from vox.hotkey import (
+    ALL_MODIFIER_FLAGS_MASK,
     KEY_CODE_TO_CHAR,
     MODIFIER_SYMBOLS,
     format_hotkey_display,
@@ -25,6 +26,50 @@ from vox.speech import (
 )
 
 
+# Shared fonts and colors, resolved once on first window build (NSApp must
+# exist before NSFont/NSColor can be queried)
+_constants_ready = False
+_FONT_11 = None
+_FONT_12 = None
+_FONT_13 = None
+_BOLD_13 = None
+_BOLD_14 = None
+_BOLD_18 = None
+_BOLD_20 = None
+_SECONDARY_COLOR = None
+_BEZEL_ROUNDED = AppKit.NSBezelStyleRounded
+_RIGHT_ALIGN = AppKit.NSTextAlignmentRight
+
+# Modifier symbols in display order, as an immutable tuple
+_SYM_TABLE = tuple(MODIFIER_SYMBOLS)
+
+# Key code -> character, indexed directly by key code (macOS codes are < 128)
+_KEYCODE_TABLE = tuple(KEY_CODE_TO_CHAR.get(i) for i in range(128))
+
+# Backspace, Delete, Escape clear the recorded shortcut
+_CLEAR_KEYS = frozenset((0x33, 0x75, 0x35))
+
+# Hotkey row labels for the settings page, in display order
+_MODE_LABELS = tuple((mode, DISPLAY_NAMES[mode] + ":") for mode in RewriteMode)
+
+
+def _init_constants():
+    """Resolve the shared fonts and colors used by the preferences window."""
+    global _constants_ready, _FONT_11, _FONT_12, _FONT_13
+    global _BOLD_13, _BOLD_14, _BOLD_18, _BOLD_20, _SECONDARY_COLOR
+    if _constants_ready:
+        return
+    _FONT_11 = AppKit.NSFont.systemFontOfSize_(11)
+    _FONT_12 = AppKit.NSFont.systemFontOfSize_(12)
+    _FONT_13 = AppKit.NSFont.systemFontOfSize_(13)
+    _BOLD_13 = AppKit.NSFont.boldSystemFontOfSize_(13)
+    _BOLD_14 = AppKit.NSFont.boldSystemFontOfSize_(14)
+    _BOLD_18 = AppKit.NSFont.boldSystemFontOfSize_(18)
+    _BOLD_20 = AppKit.NSFont.boldSystemFontOfSize_(20)
+    _SECONDARY_COLOR = AppKit.NSColor.secondaryLabelColor()
+    _constants_ready = True
+
+
 class EditableTextField(AppKit.NSTextField):
     """NSTextField subclass that supports Cmd+C/V/X/A in modal sessions."""
 
@@ -54,17 +99,35 @@ class HotkeyRecorderField(AppKit.NSTextField):
         self._modifiers_mask = 0
         self._key_char = ""
         self._recording = False
+        self._last_display = ""
         return self
 
+    def _set_display(self, text):
+        """Update the shown text, skipping the redraw if it is unchanged."""
+        if text != self._last_display:
+            self._last_display = text
+            self.setStringValue_(text)
+
     def set_hotkey(self, modifiers_str, key_str):
         if not key_str:
             self._modifiers_mask = 0
             self._key_char = ""
-            self.setStringValue_("None")
+            self._set_display("None")
             return
         self._modifiers_mask = parse_modifiers(modifiers_str)
         self._key_char = key_str.lower()
-        self.setStringValue_(format_hotkey_display(self._modifiers_mask, self._key_char))
+        self._set_display(format_hotkey_display(self._modifiers_mask, self._key_char))
+
+    def set_hotkey_raw(self, mask, key_char, display=None):
+        """Set the shortcut from an already parsed modifier mask."""
+        if not key_char:
+            self._modifiers_mask = 0
+            self._key_char = ""
+            self._set_display("None")
+            return
+        self._modifiers_mask = mask
+        self._key_char = key_char.lower()
+        self._set_display(display or format_hotkey_display(mask, self._key_char))
 
     def get_modifiers_string(self):
         return modifier_mask_to_string(self._modifiers_mask)
@@ -79,16 +142,16 @@ class HotkeyRecorderField(AppKit.NSTextField):
         result = objc.super(HotkeyRecorderField, self).becomeFirstResponder()
         if result:
             self._recording = True
-            self.setStringValue_("Press shortcut...")
+            self._set_display("Press shortcut...")
         return result
 
     def resignFirstResponder(self):
         if self._recording:
             self._recording = False
             if self._key_char:
-                self.setStringValue_(format_hotkey_display(self._modifiers_mask, self._key_char))
+                self._set_display(format_hotkey_display(self._modifiers_mask, self._key_char))
             else:
-                self.setStringValue_("None")
+                self._set_display("None")
         return objc.super(HotkeyRecorderField, self).resignFirstResponder()
 
     def performKeyEquivalent_(self, event):
@@ -107,45 +170,36 @@ class HotkeyRecorderField(AppKit.NSTextField):
         if not self._recording:
             objc.super(HotkeyRecorderField, self).flagsChanged_(event)
             return
-        flags = event.modifierFlags()
-        mask = 0
-        for flag, _ in MODIFIER_SYMBOLS:
-            if flags & flag:
-                mask |= flag
+        mask = event.modifierFlags() & ALL_MODIFIER_FLAGS_MASK
         if mask:
-            symbols = "".join(sym for f, sym in MODIFIER_SYMBOLS if mask & f)
-            self.setStringValue_(symbols + "...")
+            symbols = "".join(sym for f, sym in _SYM_TABLE if mask & f)
+            self._set_display(symbols + "...")
         else:
-            self.setStringValue_("Press shortcut...")
+            self._set_display("Press shortcut...")
 
     def _process_key_event(self, event):
         keycode = event.keyCode()
-        if keycode in (0x33, 0x75, 0x35):  # Backspace, Delete, Escape
+        if keycode in _CLEAR_KEYS:
             self._modifiers_mask = 0
             self._key_char = ""
             self._recording = False
-            self.setStringValue_("None")
+            self._set_display("None")
             if self.window():
                 self.window().makeFirstResponder_(None)
             return
 
-        char = KEY_CODE_TO_CHAR.get(keycode)
+        char = _KEYCODE_TABLE[keycode] if keycode < 128 else None
         if char is None:
             return
 
-        flags = event.modifierFlags()
-        mask = 0
-        for flag, _ in MODIFIER_SYMBOLS:
-            if flags & flag:
-                mask |= flag
-
+        mask = event.modifierFlags() & ALL_MODIFIER_FLAGS_MASK
         if not mask:
             return
 
         self._modifiers_mask = mask
         self._key_char = char
         self._recording = False
-        self.setStringValue_(format_hotkey_display(mask, char))
+        self._set_display(format_hotkey_display(mask, char))
 
         if self.window():
             self.window().makeFirstResponder_(None)
@@ -162,6 +216,8 @@ class PreferencesWindowController(AppKit.NSWindowController):
     ROW_HEIGHT = 24
     ROW_SPACING = 32
     LABEL_WIDTH = 100
+    SETTINGS_PAGE = 0
+    ABOUT_PAGE = 2
 
     def init(self):
         self = objc.super(PreferencesWindowController, self).init()
@@ -183,6 +239,7 @@ class PreferencesWindowController(AppKit.NSWindowController):
         self._auto_checkbox = None
         self._thinking_checkbox = None
         self._hotkey_checkbox = None
+        self._shortcuts_label = None
 
         # Speech-to-text
         self._speech_model_manager = WhisperModelManager()
@@ -200,15 +257,63 @@ class PreferencesWindowController(AppKit.NSWindowController):
         self._save_callback = callback
 
     def showWindow_(self, sender):
-        """Create and show the window."""
+        """Create the window on first use, refresh its values and show it."""
         if self.window() is None:
             self._create_window()
+        # An open window may hold unsaved edits; only refresh a hidden one
+        if not self.window().isVisible():
+            self._load_settings_values()
         AppKit.NSApp.activateIgnoringOtherApps_(True)
         self.window().makeKeyAndOrderFront_(None)
 
+    def _load_settings_values(self):
+        """Fill the existing settings, speech and about widgets from the config."""
+        on, off = AppKit.NSControlStateValueOn, AppKit.NSControlStateValueOff
+
+        self._api_field.setStringValue_(self._config.get_api_key() or "")
+        self._model_field.setStringValue_(self._config.model or "gpt-4o-mini")
+        self._url_field.setStringValue_(self._config.base_url or "")
+        self._auto_checkbox.setState_(on if self._config.auto_start else off)
+        self._thinking_checkbox.setState_(on if self._config.thinking_mode else off)
+        self._hotkey_checkbox.setState_(on if self._config.hotkeys_enabled else off)
+
+        parsed_hotkeys = self._config.get_parsed_hotkeys()
+        for mode_value, recorder in self._hotkey_recorders.items():
+            info = parsed_hotkeys.get(mode_value)
+            if info is not None:
+                recorder.set_hotkey_raw(info.mask, info.key, info.display)
+            else:
+                recorder.set_hotkey_raw(0, "")
+
+        self._speech_enabled_checkbox.setState_(on if self._config.speech_enabled else off)
+
+        model_names = list(WHISPER_MODELS.keys())
+        if self._config.speech_model in model_names:
+            self._speech_model_popup.selectItemAtIndex_(
+                model_names.index(self._config.speech_model)
+            )
+        self._update_download_button()
+
+        lang_codes = list(SUPPORTED_LANGUAGES.keys())
+        if self._config.speech_language in lang_codes:
+            self._speech_lang_popup.selectItemAtIndex_(
+                lang_codes.index(self._config.speech_language)
+            )
+
+        hk = self._config.get_speech_hotkey()
+        self._speech_hotkey_recorder.set_hotkey(hk["modifiers"], hk["key"])
+
+        self._shortcuts_label.setStringValue_("\n".join(
+            f"{info.display}    {DISPLAY_NAMES[mode]}"
+            for mode in RewriteMode
+            for info in (parsed_hotkeys.get(mode.value),)
+            if info is not None and info.key
+        ))
+
     def _create_window(self):
         """Create the preferences window with sidebar."""
-        frame = Foundation.NSMakeRect(100, 100, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        _init_constants()
+        frame = Foundation.NSMakeRect(0, 0, self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
 
         style_mask = (
             AppKit.NSWindowStyleMaskTitled
@@ -221,10 +326,19 @@ class PreferencesWindowController(AppKit.NSWindowController):
             False,
         )
         window.setTitle_("Vox Preferences")
+        # Keep the window alive when closed so re-opening reuses it
+        window.setReleasedWhenClosed_(False)
+        window.center()
         window.setMinSize_((500, 400))
         window.setDelegate_(self)
 
         content_view = window.contentView()
+        # Layer-back the content view so Core Animation composites the
+        # window instead of AppKit re-rasterizing it on every update. Each
+        # subview keeps its own layer: the pages hold editable fields, the
+        # hotkey recorder and a progress indicator, which must redraw on
+        # their own rather than being flattened into one backing layer.
+        content_view.setWantsLayer_(True)
         content_height = self.WINDOW_HEIGHT
 
         # Create sidebar
@@ -251,13 +365,12 @@ class PreferencesWindowController(AppKit.NSWindowController):
         self._content_container = AppKit.NSView.alloc().initWithFrame_(content_frame)
         content_view.addSubview_(self._content_container)
 
-        # Add sidebar buttons
+        # Add sidebar buttons, laid out in one pass by a vertical stack view
         sidebar_items = ["Settings", "Speech", "About"]
-        button_y = content_height - 50
 
         for i, title in enumerate(sidebar_items):
             button = AppKit.NSButton.alloc().initWithFrame_(
-                Foundation.NSMakeRect(10, button_y - (i * 36), self.SIDEBAR_WIDTH - 20, 28)
+                Foundation.NSMakeRect(0, 0, self.SIDEBAR_WIDTH - 20, 28)
             )
             button.setTitle_(title)
             button.setTag_(i)
@@ -265,36 +378,51 @@ class PreferencesWindowController(AppKit.NSWindowController):
             button.setTarget_(self)
             button.setBordered_(False)
             button.setAlignment_(AppKit.NSTextAlignmentLeft)
-            button.setFont_(AppKit.NSFont.systemFontOfSize_(13))
+            button.setFont_(_FONT_13)
 
             if i == 0:
-                button.setFont_(AppKit.NSFont.boldSystemFontOfSize_(13))
+                button.setFont_(_BOLD_13)
 
-            sidebar.addSubview_(button)
             self._sidebar_buttons.append(button)
 
+        stack_height = len(sidebar_items) * 36 - 8
+        stack = AppKit.NSStackView.stackViewWithViews_(self._sidebar_buttons)
+        stack.setOrientation_(AppKit.NSUserInterfaceLayoutOrientationVertical)
+        stack.setAlignment_(AppKit.NSLayoutAttributeLeading)
+        stack.setDistribution_(AppKit.NSStackViewDistributionFillEqually)
+        stack.setSpacing_(8)
+        stack.setFrame_(
+            Foundation.NSMakeRect(10, content_height - 22 - stack_height, self.SIDEBAR_WIDTH - 20, stack_height)
+        )
+        # Stretch every button across the stack so its click area stays the
+        # full row rather than shrinking to the title's width
+        for button in self._sidebar_buttons:
+            button.widthAnchor().constraintEqualToAnchor_(stack.widthAnchor()).setActive_(True)
+        sidebar.addSubview_(stack)
+
         # Create content views
         self._create_settings_view()
         self._create_speech_view()
         self._create_about_view()
 
         # Show first page
-        self._show_page(0)
+        self._show_page(self.SETTINGS_PAGE)
 
         self.setWindow_(window)
 
     def sidebarButtonClicked_(self, sender):
         """Handle sidebar button click."""
-        tag = sender.tag()
+        self.select_page(sender.tag())
 
-        # Update button styles
+    def select_page(self, page_index: int):
+        """Select a sidebar page and update the button styles."""
         for i, button in enumerate(self._sidebar_buttons):
-            if i == tag:
-                button.setFont_(AppKit.NSFont.boldSystemFontOfSize_(13))
+            if i == page_index:
+                button.setFont_(_BOLD_13)
             else:
-                button.setFont_(AppKit.NSFont.systemFontOfSize_(13))
+                button.setFont_(_FONT_13)
 
-        self._show_page(tag)
+        self._show_page(page_index)
 
     def _show_page(self, page_index: int):
         """Show the specified page."""
@@ -302,20 +430,39 @@ class PreferencesWindowController(AppKit.NSWindowController):
             view.setHidden_(key != page_index)
         self._current_page = page_index
 
+    def _create_static_text(self, text: str, frame: tuple, font, color=None,
+                            multiline: bool = False) -> AppKit.NSTextField:
+        """
+        Create a non-editable text label.
+
+        Args:
+            text: The label text.
+            frame: (x, y, width, height) of the label.
+            font: The NSFont to use.
+            color: Optional NSColor for the text.
+            multiline: Whether the text spans several lines.
+        """
+        # The label factories return a borderless, background-less,
+        # non-editable field in one call
+        if multiline:
+            label = AppKit.NSTextField.wrappingLabelWithString_(text)
+            label.setSelectable_(False)
+        else:
+            label = AppKit.NSTextField.labelWithString_(text)
+        label.setFrame_(Foundation.NSMakeRect(*frame))
+        if color is not None:
+            label.setTextColor_(color)
+        label.setFont_(font)
+        return label
+
     def _create_label(self, text: str, y: float, width: float = None) -> AppKit.NSTextField:
         """Create a right-aligned label."""
         if width is None:
             width = self.LABEL_WIDTH
-        label = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, width, self.ROW_HEIGHT)
+        label = self._create_static_text(
+            text, (self.CONTENT_PADDING, y, width, self.ROW_HEIGHT), _FONT_13
         )
-        label.setStringValue_(text)
-        label.setBezeled_(False)
-        label.setDrawsBackground_(False)
-        label.setEditable_(False)
-        label.setSelectable_(False)
-        label.setAlignment_(AppKit.NSTextAlignmentRight)
-        label.setFont_(AppKit.NSFont.systemFontOfSize_(13))
+        label.setAlignment_(_RIGHT_ALIGN)
         return label
 
     def _create_text_field(self, y: float, width: float, placeholder: str = "") -> EditableTextField:
@@ -326,9 +473,24 @@ class PreferencesWindowController(AppKit.NSWindowController):
         )
         field.setPlaceholderString_(placeholder)
         field.setEditable_(True)
-        field.setFont_(AppKit.NSFont.systemFontOfSize_(13))
+        field.setFont_(_FONT_13)
         return field
 
+    def _create_checkbox(self, title: str, frame: tuple) -> AppKit.NSButton:
+        """Create a checkbox; frame is (x, y, width, height)."""
+        checkbox = AppKit.NSButton.checkboxWithTitle_target_action_(title, None, None)
+        checkbox.setFrame_(Foundation.NSMakeRect(*frame))
+        return checkbox
+
+    def _create_save_button(self, container_width: float) -> AppKit.NSButton:
+        """Create the Save button in the bottom-right corner of a page."""
+        save_btn = AppKit.NSButton.buttonWithTitle_target_action_(
+            "Save", self, "saveSettings:"
+        )
+        save_btn.setFrame_(Foundation.NSMakeRect(container_width - 100, 15, 80, 28))
+        save_btn.setBezelStyle_(_BEZEL_ROUNDED)
+        return save_btn
+
     def _create_settings_view(self):
         """Create the settings content view."""
         container_width = self._content_container.frame().size.width
@@ -338,64 +500,49 @@ class PreferencesWindowController(AppKit.NSWindowController):
         view = AppKit.NSView.alloc().initWithFrame_(
             Foundation.NSMakeRect(0, 0, container_width, container_height)
         )
+        subviews = []
 
         # Title
-        title = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, container_height - 36, 200, 24)
-        )
-        title.setStringValue_("Settings")
-        title.setBezeled_(False)
-        title.setDrawsBackground_(False)
-        title.setEditable_(False)
-        title.setSelectable_(False)
-        title.setFont_(AppKit.NSFont.boldSystemFontOfSize_(20))
-        view.addSubview_(title)
+        subviews.append(self._create_static_text(
+            "Settings",
+            (self.CONTENT_PADDING, container_height - 36, 200, 24),
+            _BOLD_20,
+        ))
 
         y = container_height - 75
 
         # API Key
-        view.addSubview_(self._create_label("API Key:", y))
+        subviews.append(self._create_label("API Key:", y))
         self._api_field = self._create_text_field(y, field_width, "sk-...")
-        self._api_field.setStringValue_(self._config.get_api_key() or "")
-        view.addSubview_(self._api_field)
+        subviews.append(self._api_field)
         y -= self.ROW_SPACING
 
         # Model
-        view.addSubview_(self._create_label("Model:", y))
+        subviews.append(self._create_label("Model:", y))
         self._model_field = self._create_text_field(y, field_width, "gpt-4o-mini")
-        self._model_field.setStringValue_(self._config.model or "gpt-4o-mini")
-        view.addSubview_(self._model_field)
+        subviews.append(self._model_field)
         y -= self.ROW_SPACING
 
         # Base URL
-        view.addSubview_(self._create_label("Base URL:", y))
+        subviews.append(self._create_label("Base URL:", y))
         self._url_field = self._create_text_field(y, field_width, "https://api.openai.com/v1 (optional)")
-        self._url_field.setStringValue_(self._config.base_url or "")
-        view.addSubview_(self._url_field)
+        subviews.append(self._url_field)
         y -= self.ROW_SPACING
 
         # Launch at login
-        self._auto_checkbox = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING + self.LABEL_WIDTH + 10, y, 200, self.ROW_HEIGHT)
-        )
-        self._auto_checkbox.setButtonType_(AppKit.NSSwitchButton)
-        self._auto_checkbox.setTitle_("Launch at login")
-        self._auto_checkbox.setState_(
-            AppKit.NSControlStateValueOn if self._config.auto_start else AppKit.NSControlStateValueOff
+        self._auto_checkbox = self._create_checkbox(
+            "Launch at login",
+            (self.CONTENT_PADDING + self.LABEL_WIDTH + 10, y, 200, self.ROW_HEIGHT),
         )
-        view.addSubview_(self._auto_checkbox)
+        subviews.append(self._auto_checkbox)
         y -= self.ROW_SPACING
 
         # Thinking mode
-        self._thinking_checkbox = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING + self.LABEL_WIDTH + 10, y, 250, self.ROW_HEIGHT)
+        self._thinking_checkbox = self._create_checkbox(
+            "Thinking mode",
+            (self.CONTENT_PADDING + self.LABEL_WIDTH + 10, y, 250, self.ROW_HEIGHT),
         )
-        self._thinking_checkbox.setButtonType_(AppKit.NSSwitchButton)
-        self._thinking_checkbox.setTitle_("Thinking mode")
-        self._thinking_checkbox.setState_(
-            AppKit.NSControlStateValueOn if self._config.thinking_mode else AppKit.NSControlStateValueOff
-        )
-        view.addSubview_(self._thinking_checkbox)
+        subviews.append(self._thinking_checkbox)
         y -= 45
 
         # Separator
@@ -403,75 +550,50 @@ class PreferencesWindowController(AppKit.NSWindowController):
             Foundation.NSMakeRect(self.CONTENT_PADDING, y, container_width - 40, 1)
         )
         sep.setBoxType_(AppKit.NSBoxSeparator)
-        view.addSubview_(sep)
+        subviews.append(sep)
         y -= 30
 
         # Hot Keys header
-        hk_header = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 200, 20)
-        )
-        hk_header.setStringValue_("Hot Keys")
-        hk_header.setBezeled_(False)
-        hk_header.setDrawsBackground_(False)
-        hk_header.setEditable_(False)
-        hk_header.setSelectable_(False)
-        hk_header.setFont_(AppKit.NSFont.boldSystemFontOfSize_(14))
-        view.addSubview_(hk_header)
+        subviews.append(self._create_static_text(
+            "Hot Keys",
+            (self.CONTENT_PADDING, y, 200, 20),
+            _BOLD_14,
+        ))
         y -= 30
 
         # Enable hot keys
-        self._hotkey_checkbox = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 200, self.ROW_HEIGHT)
+        self._hotkey_checkbox = self._create_checkbox(
+            "Enable hot keys",
+            (self.CONTENT_PADDING, y, 200, self.ROW_HEIGHT),
         )
-        self._hotkey_checkbox.setButtonType_(AppKit.NSSwitchButton)
-        self._hotkey_checkbox.setTitle_("Enable hot keys")
-        self._hotkey_checkbox.setState_(
-            AppKit.NSControlStateValueOn if self._config.hotkeys_enabled else AppKit.NSControlStateValueOff
-        )
-        view.addSubview_(self._hotkey_checkbox)
+        subviews.append(self._hotkey_checkbox)
         y -= 32
 
         # Hotkey recorders
         self._hotkey_recorders = {}
-        all_hotkeys = self._config.get_all_hotkeys()
-
-        for mode in RewriteMode:
-            view.addSubview_(self._create_label(DISPLAY_NAMES[mode] + ":", y))
+        for mode, label_text in _MODE_LABELS:
+            subviews.append(self._create_label(label_text, y))
 
             recorder = HotkeyRecorderField.alloc().initWithFrame_(
                 Foundation.NSMakeRect(self.CONTENT_PADDING + self.LABEL_WIDTH + 10, y, 120, self.ROW_HEIGHT)
             )
-            hk = all_hotkeys.get(mode.value, {"modifiers": "", "key": ""})
-            recorder.set_hotkey(hk["modifiers"], hk["key"])
             recorder.setEditable_(True)
-            view.addSubview_(recorder)
+            subviews.append(recorder)
 
             self._hotkey_recorders[mode.value] = recorder
             y -= self.ROW_SPACING
 
         # Help text
-        help_text = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, container_width - 40, 18)
-        )
-        help_text.setStringValue_("Click a shortcut field and press keys. Press Delete to clear.")
-        help_text.setBezeled_(False)
-        help_text.setDrawsBackground_(False)
-        help_text.setEditable_(False)
-        help_text.setSelectable_(False)
-        help_text.setTextColor_(AppKit.NSColor.secondaryLabelColor())
-        help_text.setFont_(AppKit.NSFont.systemFontOfSize_(11))
-        view.addSubview_(help_text)
+        subviews.append(self._create_static_text(
+            "Click a shortcut field and press keys. Press Delete to clear.",
+            (self.CONTENT_PADDING, y, container_width - 40, 18),
+            _FONT_11, _SECONDARY_COLOR,
+        ))
 
         # Save button
-        save_btn = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(container_width - 100, 15, 80, 28)
-        )
-        save_btn.setTitle_("Save")
-        save_btn.setBezelStyle_(AppKit.NSBezelStyleRounded)
-        save_btn.setAction_("saveSettings:")
-        save_btn.setTarget_(self)
-        view.addSubview_(save_btn)
+        subviews.append(self._create_save_button(container_width))
 
+        view.setSubviews_(subviews)
         self._content_container.addSubview_(view)
         self._content_views[0] = view
 
@@ -483,35 +605,27 @@ class PreferencesWindowController(AppKit.NSWindowController):
         view = AppKit.NSView.alloc().initWithFrame_(
             Foundation.NSMakeRect(0, 0, container_width, container_height)
         )
+        subviews = []
 
         # Title
-        title = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, container_height - 36, 200, 24)
-        )
-        title.setStringValue_("Speech")
-        title.setBezeled_(False)
-        title.setDrawsBackground_(False)
-        title.setEditable_(False)
-        title.setSelectable_(False)
-        title.setFont_(AppKit.NSFont.boldSystemFontOfSize_(20))
-        view.addSubview_(title)
+        subviews.append(self._create_static_text(
+            "Speech",
+            (self.CONTENT_PADDING, container_height - 36, 200, 24),
+            _BOLD_20,
+        ))
 
         y = container_height - 75
 
         # Enable Speech
-        self._speech_enabled_checkbox = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 250, self.ROW_HEIGHT)
+        self._speech_enabled_checkbox = self._create_checkbox(
+            "Enable Speech-to-Text",
+            (self.CONTENT_PADDING, y, 250, self.ROW_HEIGHT),
         )
-        self._speech_enabled_checkbox.setButtonType_(AppKit.NSSwitchButton)
-        self._speech_enabled_checkbox.setTitle_("Enable Speech-to-Text")
-        self._speech_enabled_checkbox.setState_(
-            AppKit.NSControlStateValueOn if self._config.speech_enabled else AppKit.NSControlStateValueOff
-        )
-        view.addSubview_(self._speech_enabled_checkbox)
+        subviews.append(self._speech_enabled_checkbox)
         y -= 45
 
         # Model selection
-        view.addSubview_(self._create_label("Model:", y))
+        subviews.append(self._create_label("Model:", y))
 
         # Model popup button
         popup_x = self.CONTENT_PADDING + self.LABEL_WIDTH + 10
@@ -528,26 +642,19 @@ class PreferencesWindowController(AppKit.NSWindowController):
                 label += " ✓"
             self._speech_model_popup.addItemWithTitle_(label)
 
-        # Select current model
-        current_model = self._config.speech_model
-        model_names = list(WHISPER_MODELS.keys())
-        if current_model in model_names:
-            self._speech_model_popup.selectItemAtIndex_(model_names.index(current_model))
-
         self._speech_model_popup.setAction_("modelChanged:")
         self._speech_model_popup.setTarget_(self)
-        view.addSubview_(self._speech_model_popup)
+        subviews.append(self._speech_model_popup)
 
         # Download button
         self._speech_download_btn = AppKit.NSButton.alloc().initWithFrame_(
             Foundation.NSMakeRect(popup_x + 160, y, 100, self.ROW_HEIGHT)
         )
         self._speech_download_btn.setTitle_("Download")
-        self._speech_download_btn.setBezelStyle_(AppKit.NSBezelStyleRounded)
+        self._speech_download_btn.setBezelStyle_(_BEZEL_ROUNDED)
         self._speech_download_btn.setAction_("downloadModel:")
         self._speech_download_btn.setTarget_(self)
-        self._update_download_button()
-        view.addSubview_(self._speech_download_btn)
+        subviews.append(self._speech_download_btn)
 
         y -= self.ROW_SPACING
 
@@ -560,11 +667,11 @@ class PreferencesWindowController(AppKit.NSWindowController):
         self._speech_progress.setMaxValue_(1.0)
         self._speech_progress.setIndeterminate_(False)
         self._speech_progress.setHidden_(True)
-        view.addSubview_(self._speech_progress)
+        subviews.append(self._speech_progress)
         y -= self.ROW_SPACING
 
         # Language selection
-        view.addSubview_(self._create_label("Language:", y))
+        subviews.append(self._create_label("Language:", y))
 
         self._speech_lang_popup = AppKit.NSPopUpButton.alloc().initWithFrame_pullsDown_(
             Foundation.NSMakeRect(popup_x, y, 150, self.ROW_HEIGHT), False
@@ -573,53 +680,33 @@ class PreferencesWindowController(AppKit.NSWindowController):
         for code, name in SUPPORTED_LANGUAGES.items():
             self._speech_lang_popup.addItemWithTitle_(name)
 
-        # Select current language
-        current_lang = self._config.speech_language
-        lang_codes = list(SUPPORTED_LANGUAGES.keys())
-        if current_lang in lang_codes:
-            self._speech_lang_popup.selectItemAtIndex_(lang_codes.index(current_lang))
-
-        view.addSubview_(self._speech_lang_popup)
+        subviews.append(self._speech_lang_popup)
         y -= self.ROW_SPACING
 
         # Speech hotkey
-        view.addSubview_(self._create_label("Hotkey:", y))
+        subviews.append(self._create_label("Hotkey:", y))
 
         self._speech_hotkey_recorder = HotkeyRecorderField.alloc().initWithFrame_(
             Foundation.NSMakeRect(popup_x, y, 120, self.ROW_HEIGHT)
         )
-        hk = self._config.get_speech_hotkey()
-        self._speech_hotkey_recorder.set_hotkey(hk["modifiers"], hk["key"])
         self._speech_hotkey_recorder.setEditable_(True)
-        view.addSubview_(self._speech_hotkey_recorder)
+        subviews.append(self._speech_hotkey_recorder)
         y -= self.ROW_SPACING
 
         # Help text
-        help_text = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, container_width - 40, 36)
-        )
-        help_text.setStringValue_(
-            "Press and hold the hotkey to record. Release to transcribe.\n"
-            "The transcribed text will be pasted at the cursor."
-        )
-        help_text.setBezeled_(False)
-        help_text.setDrawsBackground_(False)
-        help_text.setEditable_(False)
-        help_text.setSelectable_(False)
-        help_text.setTextColor_(AppKit.NSColor.secondaryLabelColor())
-        help_text.setFont_(AppKit.NSFont.systemFontOfSize_(11))
-        view.addSubview_(help_text)
+        subviews.append(self._create_static_text(
+            (
+                "Press and hold the hotkey to record. Release to transcribe.\n"
+                "The transcribed text will be pasted at the cursor."
+            ),
+            (self.CONTENT_PADDING, y, container_width - 40, 36),
+            _FONT_11, _SECONDARY_COLOR, multiline=True,
+        ))
 
         # Save button
-        save_btn = AppKit.NSButton.alloc().initWithFrame_(
-            Foundation.NSMakeRect(container_width - 100, 15, 80, 28)
-        )
-        save_btn.setTitle_("Save")
-        save_btn.setBezelStyle_(AppKit.NSBezelStyleRounded)
-        save_btn.setAction_("saveSettings:")
-        save_btn.setTarget_(self)
-        view.addSubview_(save_btn)
+        subviews.append(self._create_save_button(container_width))
 
+        view.setSubviews_(subviews)
         self._content_container.addSubview_(view)
         self._content_views[1] = view
 
@@ -703,105 +790,74 @@ class PreferencesWindowController(AppKit.NSWindowController):
         view = AppKit.NSView.alloc().initWithFrame_(
             Foundation.NSMakeRect(0, 0, container_width, container_height)
         )
+        subviews = []
 
         # Title
-        title = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, container_height - 36, 200, 24)
-        )
-        title.setStringValue_("About Vox")
-        title.setBezeled_(False)
-        title.setDrawsBackground_(False)
-        title.setEditable_(False)
-        title.setSelectable_(False)
-        title.setFont_(AppKit.NSFont.boldSystemFontOfSize_(20))
-        view.addSubview_(title)
+        subviews.append(self._create_static_text(
+            "About Vox",
+            (self.CONTENT_PADDING, container_height - 36, 200, 24),
+            _BOLD_20,
+        ))
 
         y = container_height - 70
 
         # App name
-        app_name = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 200, 24)
-        )
-        app_name.setStringValue_("Vox")
-        app_name.setBezeled_(False)
-        app_name.setDrawsBackground_(False)
-        app_name.setEditable_(False)
-        app_name.setSelectable_(False)
-        app_name.setFont_(AppKit.NSFont.boldSystemFontOfSize_(18))
-        view.addSubview_(app_name)
+        subviews.append(self._create_static_text(
+            "Vox",
+            (self.CONTENT_PADDING, y, 200, 24),
+            _BOLD_18,
+        ))
         y -= 25
 
         # Version
-        version = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 200, 18)
-        )
-        version.setStringValue_("Version 0.1.0")
-        version.setBezeled_(False)
-        version.setDrawsBackground_(False)
-        version.setEditable_(False)
-        version.setSelectable_(False)
-        version.setTextColor_(AppKit.NSColor.secondaryLabelColor())
-        version.setFont_(AppKit.NSFont.systemFontOfSize_(12))
-        view.addSubview_(version)
+        subviews.append(self._create_static_text(
+            "Version 0.1.0",
+            (self.CONTENT_PADDING, y, 200, 18),
+            _FONT_12, _SECONDARY_COLOR,
+        ))
         y -= 35
 
         # Description
-        desc = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y - 40, container_width - 40, 60)
-        )
-        desc.setStringValue_(
-            "AI-powered text rewriting through macOS contextual menu.\n\n"
-            "Select text in any app, right-click, and choose a rewrite mode."
-        )
-        desc.setBezeled_(False)
-        desc.setDrawsBackground_(False)
-        desc.setEditable_(False)
-        desc.setSelectable_(False)
-        desc.setFont_(AppKit.NSFont.systemFontOfSize_(12))
-        view.addSubview_(desc)
+        subviews.append(self._create_static_text(
+            (
+                "AI-powered text rewriting through macOS contextual menu.\n\n"
+                "Select text in any app, right-click, and choose a rewrite mode."
+            ),
+            (self.CONTENT_PADDING, y - 40, container_width - 40, 60),
+            _FONT_12, multiline=True,
+        ))
         y -= 110
 
         # Shortcuts header
-        shortcuts_hdr = AppKit.NSTextField.alloc().initWithFrame_(
-            Foundation.NSMakeRect(self.CONTENT_PADDING, y, 200, 18)
-        )
-        shortcuts_hdr.setStringValue_("Keyboard Shortcuts")
-        shortcuts_hdr.setBezeled_(False)
-        shortcuts_hdr.setDrawsBackground_(False)
-        shortcuts_hdr.setEditable_(False)
-        shortcuts_hdr.setSelectable_(False)
-        shortcuts_hdr.setFont_(AppKit.NSFont.boldSystemFontOfSize_(14))
-        view.addSubview_(shortcuts_hdr)
+        subviews.append(self._create_static_text(
+            "Keyboard Shortcuts",
+            (self.CONTENT_PADDING, y, 200, 18),
+            _BOLD_14,
+        ))
         y -= 25
 
-        # List shortcuts
-        all_hotkeys = self._config.get_all_hotkeys()
-        for mode in RewriteMode:
-            hk = all_hotkeys.get(mode.value, {"modifiers": "", "key": ""})
-            if hk["key"]:
-                mod_mask = parse_modifiers(hk["modifiers"])
-                display = format_hotkey_display(mod_mask, hk["key"])
-
-                shortcut = AppKit.NSTextField.alloc().initWithFrame_(
-                    Foundation.NSMakeRect(self.CONTENT_PADDING, y, container_width - 40, 18)
-                )
-                shortcut.setStringValue_(f"{display}    {DISPLAY_NAMES[mode]}")
-                shortcut.setBezeled_(False)
-                shortcut.setDrawsBackground_(False)
-                shortcut.setEditable_(False)
-                shortcut.setSelectable_(False)
-                shortcut.setFont_(AppKit.NSFont.systemFontOfSize_(12))
-                view.addSubview_(shortcut)
-                y -= 22
+        # List shortcuts (one multi-line label, filled in by _load_settings_values)
+        rows = len(_MODE_LABELS)
+        self._shortcuts_label = self._create_static_text(
+            "",
+            (self.CONTENT_PADDING, y - 18 * (rows - 1), container_width - 40, 18 * rows),
+            _FONT_12, multiline=True,
+        )
+        subviews.append(self._shortcuts_label)
 
+        view.setSubviews_(subviews)
         self._content_container.addSubview_(view)
         self._content_views[2] = view
 
     def saveSettings_(self, sender):
         """Save the settings."""
-        api_key = self._api_field.stringValue().strip()
-        model = self._model_field.stringValue().strip() or "gpt-4o-mini"
-        base_url = self._url_field.stringValue().strip() or None
+        # Bridge each NSString to a Python str exactly once
+        api_key, model, base_url = (
+            str(field.stringValue()).strip()
+            for field in (self._api_field, self._model_field, self._url_field)
+        )
+        model = model or "gpt-4o-mini"
+        base_url = base_url or None
         auto_start = self._auto_checkbox.state() == AppKit.NSControlStateValueOn
         thinking_mode = self._thinking_checkbox.state() == AppKit.NSControlStateValueOn
         hotkeys_enabled = self._hotkey_checkbox.state() == AppKit.NSControlStateValueOn
@@ -829,36 +885,16 @@ class PreferencesWindowController(AppKit.NSWindowController):
             "key": self._speech_hotkey_recorder.get_key_string(),
         }
 
-        # Save to config
-        if api_key:
-            self._config.set_api_key(api_key)
-
-        self._config.model = model
-        self._config.base_url = base_url
-
-        if auto_start != self._config.auto_start:
-            self._config.set_auto_start(auto_start)
-
-        self._config.thinking_mode = thinking_mode
-
-        self._config.hotkeys_enabled = hotkeys_enabled
-        for mode_value, hk in hotkey_configs.items():
-            self._config.set_mode_hotkey(mode_value, hk["modifiers"], hk["key"])
-
-        # Save speech settings
-        self._config.speech_enabled = speech_enabled
-        self._config.speech_model = speech_model
-        self._config.speech_language = speech_language
-        self._config.set_speech_hotkey(speech_hotkey["modifiers"], speech_hotkey["key"])
-
-        if self._save_callback:
-            self._save_callback(
-                api_key, model, base_url, auto_start, hotkeys_enabled, hotkey_configs,
-                speech_enabled, speech_model, speech_language, speech_hotkey,
-                thinking_mode
-            )
+        # MenuBarApp's save callback persists the values, skipping unchanged
+        # ones; show_preferences_window always sets it
+        self._save_callback(
+            api_key, model, base_url, auto_start, hotkeys_enabled, hotkey_configs,
+            speech_enabled, speech_model, speech_language, speech_hotkey,
+            thinking_mode
+        )
 
-        self.window().close()
+        # Hide rather than close so the built window is reused on the next open
+        self.window().orderOut_(None)
 
     def windowWillClose_(self, notification):
         """Handle window close."""
@@ -869,8 +905,15 @@ class PreferencesWindowController(AppKit.NSWindowController):
 _preferences_controller: Optional[PreferencesWindowController] = None
 
 
-def show_preferences_window(save_callback: Callable = None):
-    """Show the preferences window."""
+def show_preferences_window(save_callback: Callable, page: Optional[int] = None):
+    """
+    Show the preferences window.
+
+    Args:
+        save_callback: Persists the new values when settings are saved; the
+            window itself doesn't write the config.
+        page: Sidebar page to select (e.g. PreferencesWindowController.ABOUT_PAGE).
+    """
     global _preferences_controller
 
     if _preferences_controller is None:
@@ -878,3 +921,5 @@ def show_preferences_window(save_callback: Callable = None):
 
     _preferences_controller.setSaveCallback_(save_callback)
     _preferences_controller.showWindow_(None)
+    if page is not None:
+        _preferences_controller.select_page(page)
@@ -4,6 +4,7 @@ macOS Services API integration for Vox.
 Handles text processing requests from the contextual menu
 using the NSServices mechanism via PyObjC.
 """
+import logging
 import objc
 import AppKit
 from typing import Optional
@@ -11,6 +12,15 @@ from typing import Optional
 from vox.config import get_config
 from vox.api import RewriteAPI, RewriteMode, RewriteError, APIKeyError, NetworkError, RateLimitError
 from vox.notifications import ToastManager, ErrorNotifier
+from vox.worker import SerialWorker
+
+
+logger = logging.getLogger(__name__)
+
+# Loading toast text for each mode, built once
+_TOAST_MESSAGES = {
+    mode: f"{name} with Vox..." for mode, name in RewriteAPI.get_all_modes()
+}
 
 
 class ServiceProvider(AppKit.NSObject):
@@ -29,7 +39,13 @@ class ServiceProvider(AppKit.NSObject):
 
         self._toast_manager = ToastManager()
         self._api_client: Optional[RewriteAPI] = None
+        self._worker = SerialWorker("VoxService")
+        # Set while a service call waits for its result (see _call_in_background)
+        self._in_service_call = False
         self._current_mode = RewriteMode.FIX_GRAMMAR  # Default mode
+        # Custom instruction alert and its input field, built on first use
+        self._custom_alert = None
+        self._custom_input_field = None
         return self
 
     def _get_api_client(self) -> Optional[RewriteAPI]:
@@ -47,6 +63,43 @@ class ServiceProvider(AppKit.NSObject):
             self._api_client = RewriteAPI(api_key, config.model, config.base_url)
         return self._api_client
 
+    def _call_in_background(self, func, *args):
+        """
+        Run func(*args) on the service worker thread and return its result.
+
+        The service has to write its result to the pasteboard before returning,
+        so the main thread waits here. It keeps running the default run loop
+        mode meanwhile, so timers and Core Animation keep the toast updating;
+        the worker wakes it with serviceCallDone: when func finishes.
+        _in_service_call guards against a second service call starting inside
+        the wait. Exceptions from func are re-raised.
+        """
+        future = self._worker.submit(func, *args)
+        future.add_done_callback(self._notify_service_call_done)
+        run_loop = AppKit.NSRunLoop.currentRunLoop()
+        self._in_service_call = True
+        try:
+            while not future.done():
+                run_loop.runMode_beforeDate_(
+                    AppKit.NSDefaultRunLoopMode, AppKit.NSDate.distantFuture()
+                )
+        finally:
+            self._in_service_call = False
+        return future.result()
+
+    def _notify_service_call_done(self, future):
+        """Wake the main run loop once a background call finished (worker thread)."""
+        self.performSelectorOnMainThread_withObject_waitUntilDone_(
+            "serviceCallDone:", None, False
+        )
+
+    def serviceCallDone_(self, _):
+        """No-op; delivering it makes runMode_beforeDate_ return."""
+
+    def shutdown(self):
+        """Stop the service worker, dropping any queued requests."""
+        self._worker.shutdown()
+
     def _reset_api_client(self):
         """Reset the API client (e.g., when API key changes)."""
         self._api_client = None
@@ -56,67 +109,68 @@ class ServiceProvider(AppKit.NSObject):
 
     @objc.typedSelector(b"v@:@@o^@")
     def improveService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: improveService", flush=True)
+        logger.debug("Service called: improveService")
         self._handle_service(pasteboard, RewriteMode.IMPROVE)
 
     @objc.typedSelector(b"v@:@@o^@")
     def fixGrammarService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: fixGrammarService", flush=True)
+        logger.debug("Service called: fixGrammarService")
         self._handle_service(pasteboard, RewriteMode.FIX_GRAMMAR)
 
     @objc.typedSelector(b"v@:@@o^@")
     def professionalService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: professionalService", flush=True)
+        logger.debug("Service called: professionalService")
         self._handle_service(pasteboard, RewriteMode.PROFESSIONAL)
 
     @objc.typedSelector(b"v@:@@o^@")
     def conciseService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: conciseService", flush=True)
+        logger.debug("Service called: conciseService")
         self._handle_service(pasteboard, RewriteMode.CONCISE)
 
     @objc.typedSelector(b"v@:@@o^@")
     def friendlyService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: friendlyService", flush=True)
+        logger.debug("Service called: friendlyService")
         self._handle_service(pasteboard, RewriteMode.FRIENDLY)
 
     @objc.typedSelector(b"v@:@@o^@")
     def askVoxService_userData_error_(self, pasteboard, userData, error):
-        print("SERVICE CALLED: askVoxService", flush=True)
+        logger.debug("Service called: askVoxService")
         self._handle_custom_service(pasteboard)
 
     def _handle_service(self, pasteboard, mode):
         """Handle a service invocation for any mode."""
-        print(f"DEBUG _handle_service: mode={mode}", flush=True)
+        logger.debug("Handling service for mode: %s", mode.value)
+        if self._in_service_call:
+            logger.debug("Service call already in progress; ignoring")
+            return
         try:
             # Get API client
             api_client = self._get_api_client()
-            print(f"DEBUG: api_client={api_client}", flush=True)
             if api_client is None:
                 ErrorNotifier.show_api_key_error()
                 return
 
             # Read text from pasteboard
             text = self._read_text_from_pasteboard(pasteboard)
-            print(f"DEBUG: text={text!r}", flush=True)
+            logger.debug("Service text: %r", text)
             if not text:
                 return
 
             # Show loading toast
-            mode_name = RewriteAPI.get_display_name(mode)
-            self._toast_manager.show(f"{mode_name} with Vox...")
+            self._toast_manager.show(_TOAST_MESSAGES[mode])
 
             # Get thinking mode from config
             config = get_config()
             thinking_mode = config.thinking_mode
 
             # Process the text
-            print("DEBUG: calling API...", flush=True)
-            result = api_client.rewrite(text, mode, thinking_mode)
-            print(f"DEBUG: API result={result!r}", flush=True)
+            result = self._call_in_background(
+                api_client.rewrite, text, mode, thinking_mode
+            )
+            logger.debug("Service result: %r", result)
 
             # Write result back to pasteboard
             self._write_text_to_pasteboard(pasteboard, result)
-            print("DEBUG: wrote to pasteboard, done!", flush=True)
 
             # Hide toast
             self._toast_manager.hide()
@@ -138,7 +192,7 @@ class ServiceProvider(AppKit.NSObject):
             self._toast_manager.hide()
 
         except Exception as e:
-            print(f"DEBUG: EXCEPTION: {type(e).__name__}: {e}", flush=True)
+            print(f"Error handling service: {type(e).__name__}: {e}", flush=True)
             import traceback
             traceback.print_exc()
             ErrorNotifier.show_generic_error(f"Unexpected error: {e}")
@@ -146,6 +200,9 @@ class ServiceProvider(AppKit.NSObject):
 
     def _handle_custom_service(self, pasteboard):
         """Handle a custom-instruction service invocation."""
+        if self._in_service_call:
+            logger.debug("Service call already in progress; ignoring")
+            return
         try:
             api_client = self._get_api_client()
             if api_client is None:
@@ -164,7 +221,9 @@ class ServiceProvider(AppKit.NSObject):
 
             config = get_config()
             thinking_mode = config.thinking_mode
-            result = api_client.rewrite_with_instruction(text, instruction, thinking_mode)
+            result = self._call_in_background(
+                api_client.rewrite_with_instruction, text, instruction, thinking_mode
+            )
             self._write_text_to_pasteboard(pasteboard, result)
             self._toast_manager.hide()
 
@@ -185,27 +244,37 @@ class ServiceProvider(AppKit.NSObject):
             self._toast_manager.hide()
 
         except Exception as e:
-            print(f"DEBUG: EXCEPTION: {type(e).__name__}: {e}", flush=True)
+            print(f"Error handling service: {type(e).__name__}: {e}", flush=True)
             import traceback
             traceback.print_exc()
             ErrorNotifier.show_generic_error(f"Unexpected error: {e}")
             self._toast_manager.hide()
 
+    def _get_custom_instruction_alert(self) -> AppKit.NSAlert:
+        """Get the custom instruction alert, creating it on first use."""
+        if self._custom_alert is None:
+            alert = AppKit.NSAlert.alloc().init()
+            alert.setMessageText_("Ask Vox")
+            alert.setInformativeText_(
+                "Enter how you want Vox to rewrite the selected text."
+            )
+            alert.addButtonWithTitle_("Rewrite")
+            alert.addButtonWithTitle_("Cancel")
+
+            input_field = AppKit.NSTextField.alloc().initWithFrame_(
+                AppKit.NSMakeRect(0, 0, 420, 24)
+            )
+            alert.setAccessoryView_(input_field)
+
+            self._custom_alert = alert
+            self._custom_input_field = input_field
+        return self._custom_alert
+
     def _prompt_custom_instruction(self) -> Optional[str]:
         """Prompt for a custom rewrite instruction."""
-        alert = AppKit.NSAlert.alloc().init()
-        alert.setMessageText_("Ask Vox")
-        alert.setInformativeText_(
-            "Enter how you want Vox to rewrite the selected text."
-        )
-        alert.addButtonWithTitle_("Rewrite")
-        alert.addButtonWithTitle_("Cancel")
-
-        input_field = AppKit.NSTextField.alloc().initWithFrame_(
-            AppKit.NSMakeRect(0, 0, 420, 24)
-        )
+        alert = self._get_custom_instruction_alert()
+        input_field = self._custom_input_field
         input_field.setStringValue_("Improve clarity and tone")
-        alert.setAccessoryView_(input_field)
 
         AppKit.NSApp.activateIgnoringOtherApps_(True)
         response = alert.runModal()
@@ -223,12 +292,11 @@ class ServiceProvider(AppKit.NSObject):
         Returns:
             The text string if found, None otherwise.
         """
-        # Get pasteboard types
-        types = pasteboard.types()
-
-        # Check for string type
-        if AppKit.NSStringPboardType in types:
-            return pasteboard.stringForType_(AppKit.NSStringPboardType)
+        # Read string objects directly instead of the deprecated
+        # NSStringPboardType lookup
+        objects = pasteboard.readObjectsForClasses_options_([AppKit.NSString], None)
+        if objects:
+            return objects[0]
 
         return None
 
@@ -245,16 +313,14 @@ class ServiceProvider(AppKit.NSObject):
 
     def register_services(self):
         """Register the services with macOS."""
-        print(f"DEBUG register_services: self={self}", flush=True)
         AppKit.NSApp.setServicesProvider_(self)
-        print(f"DEBUG register_services: provider set, NSApp={AppKit.NSApp}", flush=True)
-        # Verify methods exist
-        print(f"DEBUG: has fixGrammarService = {self.respondsToSelector_('fixGrammarService:userData:error:')}", flush=True)
+        logger.debug("Services provider registered")
 
-    def update_api_key(self):
-        """Update the API client when the API key changes."""
-        self._reset_api_client()
+    def reload(self):
+        """
+        Drop the API client after a settings change.
 
-    def update_model(self):
-        """Update the API client when the model changes."""
+        The client is rebuilt lazily by _get_api_client() on the next service
+        call, so a save that changes several values does no client work.
+        """
         self._reset_api_client()
@@ -3,18 +3,21 @@ Menu bar application for Vox.
 
 Provides a menu bar icon with access to settings and configuration.
 """
+import logging
 import objc
 import AppKit
 from PyObjCTools import AppHelper
 from typing import Optional
 import threading
 import time
+import traceback
 import os
 import sys
 
 # Import Quartz.CoreGraphics for CGEvent functions
 from Quartz.CoreGraphics import (
     CGEventSourceCreate,
+    CGEventSourceSetLocalEventsSuppressionInterval,
     CGEventCreateKeyboardEvent,
     CGEventSetFlags,
     CGEventPost,
@@ -22,15 +25,24 @@ from Quartz.CoreGraphics import (
     kCGSessionEventTap,
     kCGEventFlagMaskCommand,
 )
+from ApplicationServices import (
+    AXUIElementCopyAttributeValue,
+    AXUIElementCreateSystemWide,
+    AXUIElementSetAttributeValue,
+    kAXErrorSuccess,
+    kAXFocusedUIElementAttribute,
+    kAXSelectedTextAttribute,
+    kAXValueAttribute,
+)
 
 from vox.config import get_config
 from vox.api import RewriteMode, RewriteAPI, APIKeyError, NetworkError, RateLimitError, RewriteError
 from vox.service import ServiceProvider
+from vox.worker import SerialWorker
 from vox.notifications import LoadingBarManager, ErrorNotifier, RecordingToastManager
 from vox.hotkey import (
     create_hotkey_manager,
 )
-from vox.preferences import show_preferences_window
 from vox.speech import (
     AudioRecorder,
     SpeechTranscriber,
@@ -41,132 +53,309 @@ from vox.speech import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+# Virtual key codes for the synthesized Cmd+C / Cmd+V shortcuts
+_KEY_COMMAND = 0x37
+_KEY_C = 0x08
+_KEY_V = 0x09
+
+# The event source and keystroke events are immutable, so build them once
+# and re-post the same objects on every hotkey
+_EVENT_SOURCE = CGEventSourceCreate(kCGEventSourceStateCombinedSessionState)
+# Events are posted back to back; don't let the system suppress local
+# keyboard input after each one
+CGEventSourceSetLocalEventsSuppressionInterval(_EVENT_SOURCE, 0)
+_CMD_DOWN = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_COMMAND, True)
+_CMD_UP = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_COMMAND, False)
+_C_DOWN = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_C, True)
+_C_UP = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_C, False)
+_V_DOWN = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_V, True)
+_V_UP = CGEventCreateKeyboardEvent(_EVENT_SOURCE, _KEY_V, False)
+# The Cmd flag is set on the Cmd key-down too, so the chord doesn't depend on
+# the modifier state being picked up between events
+for _event in (_CMD_DOWN, _C_DOWN, _C_UP, _V_DOWN, _V_UP):
+    CGEventSetFlags(_event, kCGEventFlagMaskCommand)
+del _event
+
+# Full Cmd+<key> event sequence for each synthesized shortcut
+_CMD_KEY_EVENTS = {
+    _KEY_C: (_CMD_DOWN, _C_DOWN, _C_UP, _CMD_UP),
+    _KEY_V: (_CMD_DOWN, _V_DOWN, _V_UP, _CMD_UP),
+}
+
+# Longest wait for a Cmd+C to land on the pasteboard
+_COPY_TIMEOUT = 0.2
+
+# Accessibility element for reading the focused text selection, and the
+# bundle IDs of apps whose focused element doesn't provide AXSelectedText
+_AX_SYSTEM_WIDE = AXUIElementCreateSystemWide()
+_AX_UNSUPPORTED_APPS = set()
+# Bundle IDs of apps checked to apply an AXSelectedText write synchronously,
+# as an undoable edit. paste_text writes through Accessibility only for these
+# and uses Cmd+V everywhere else: Chromium, Electron and web views can report
+# success without inserting anything, or insert outside the undo stack
+_AX_WRITE_APPS = frozenset({
+    "com.apple.TextEdit",
+})
+
+# Shared workspace, general pasteboard and string type bound once so the
+# hot paths below skip the PyObjC lookups. NSApp is not cached here because
+# it is only set once the application object exists.
+_WORKSPACE = AppKit.NSWorkspace.sharedWorkspace()
+_PASTEBOARD = AppKit.NSPasteboard.generalPasteboard()
+_PBTYPE = AppKit.NSPasteboardTypeString
+# Text written for pasting stays on this Mac instead of syncing through
+# Universal Clipboard
+_PB_CURRENT_HOST_ONLY = AppKit.NSPasteboardContentsCurrentHostOnly
+
+# Pasteboard change count right after get_selected_text restored the
+# clipboard, and the text it restored (see _snapshot_pasteboard)
+_CLIPBOARD_SNAPSHOT = (None, None)
+
+# Menu bar icon assets: bundled location when running from .app, otherwise
+# the assets folder in development mode
+if getattr(sys, 'frozen', False):
+    _ASSETS_BASE = sys._MEIPASS
+else:
+    _ASSETS_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MENU_ICON_DIR = os.path.join(_ASSETS_BASE, 'assets', 'menubar')
+# 1x and 2x pixel variants of the 18pt icon, so AppKit picks a representation
+# that matches the display scale instead of resampling one bitmap. 18pt fits
+# inside the 22pt menu bar, so the status button draws it at its own size.
+_MENU_ICON_REPS = (
+    os.path.join(_MENU_ICON_DIR, 'menuIcon18.png'),
+    os.path.join(_MENU_ICON_DIR, 'menuIcon36.png'),
+)
+_MENU_ICON_POINT_SIZE = (18, 18)
+
+# Menu bar icon, loaded once by get_menu_bar_icon()
+_ICON_CACHE: Optional[AppKit.NSImage] = None
+
+
 def get_menu_bar_icon() -> Optional[AppKit.NSImage]:
     """
     Load the menu bar icon from the bundled resources or development path.
 
+    The 1x and 2x PNGs are added as representations of a single 18pt image,
+    so no bitmap is rescaled when the status item draws. The image is cached
+    after the first successful load.
+
     Returns:
         NSImage configured as a template image, or None if not found.
     """
-    # Try bundled location first (when running from .app)
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-        icon_path = os.path.join(base_path, 'assets', 'menubar', 'menuIcon44.png')
-    else:
-        # Development mode - use the assets folder
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        icon_path = os.path.join(base_path, 'assets', 'menubar', 'menuIcon44.png')
-
-    if os.path.exists(icon_path):
-        image = AppKit.NSImage.alloc().initWithContentsOfFile_(icon_path)
-        if image:
-            image.setSize_((18, 18))  # Standard menu bar icon size
-            image.setTemplate_(True)  # Allows macOS to color it appropriately
-            return image
+    global _ICON_CACHE
+    if _ICON_CACHE is not None:
+        return _ICON_CACHE
+
+    image = None
+    for path in _MENU_ICON_REPS:
+        if not os.path.exists(path):
+            continue
+        rep = AppKit.NSBitmapImageRep.imageRepWithContentsOfFile_(path)
+        if rep is None:
+            continue
+        rep.setSize_(_MENU_ICON_POINT_SIZE)
+        if image is None:
+            image = AppKit.NSImage.alloc().initWithSize_(_MENU_ICON_POINT_SIZE)
+        image.addRepresentation_(rep)
+
+    if image is not None:
+        image.setTemplate_(True)  # Allows macOS to color it appropriately
+        _ICON_CACHE = image
+        return image
 
     return None
 
 
+def _post_cmd_key(key_code: int):
+    """Post Cmd+<key> as four back-to-back events (key_code is _KEY_C or _KEY_V)."""
+    # Bind the poster and tap locally for the four-event loop
+    post, tap = CGEventPost, kCGSessionEventTap
+    for event in _CMD_KEY_EVENTS[key_code]:
+        post(tap, event)
+
+
+def _snapshot_pasteboard(pasteboard, change_count: int) -> Optional[str]:
+    """
+    Save the clipboard text before a Cmd+C overwrites it.
+
+    Only the string type is read, so promised or lazily provided data (large
+    images, file promises) is never materialized on the hotkey path. While
+    the change count still matches the last restore, the pasteboard holds
+    the text restored then, which is reused without reading it again.
+
+    Args:
+        pasteboard: The general pasteboard.
+        change_count: The pasteboard's current change count.
+
+    Returns:
+        The clipboard text, or None if the clipboard holds no text.
+    """
+    restored_count, restored_text = _CLIPBOARD_SNAPSHOT
+    if change_count == restored_count:
+        return restored_text
+    return pasteboard.stringForType_(_PBTYPE)
+
+
+def _restore_pasteboard(pasteboard, text: str):
+    """Put the saved clipboard text back and remember it for the next snapshot."""
+    global _CLIPBOARD_SNAPSHOT
+    pasteboard.clearContents()
+    pasteboard.setString_forType_(text, _PBTYPE)
+    _CLIPBOARD_SNAPSHOT = (pasteboard.changeCount(), text)
+
+
+def _copy_ax_attribute(element, attribute):
+    """Read an Accessibility attribute, returning None on any error."""
+    err, value = AXUIElementCopyAttributeValue(element, attribute, None)
+    return value if err == kAXErrorSuccess else None
+
+
+def _get_selected_text_via_ax() -> Optional[str]:
+    """
+    Read the focused element's selected text through the Accessibility API.
+
+    Returns:
+        The selected text ("" if the element has no selection), or None if
+        the focused element doesn't provide AXSelectedText.
+    """
+    focused = _copy_ax_attribute(_AX_SYSTEM_WIDE, kAXFocusedUIElementAttribute)
+    if focused is None:
+        return None
+    text = _copy_ax_attribute(focused, kAXSelectedTextAttribute)
+    if text is None:
+        return None
+    return str(text)
+
+
+def _replace_selection_via_ax(text: str) -> bool:
+    """
+    Replace the focused element's selection through the Accessibility API.
+
+    Only used for _AX_WRITE_APPS, which apply the write synchronously, so the
+    element's value is read back to check that the write changed it.
+
+    Returns:
+        True if the text was inserted, False if nothing was inserted and the
+        caller should paste instead.
+    """
+    focused = _copy_ax_attribute(_AX_SYSTEM_WIDE, kAXFocusedUIElementAttribute)
+    if focused is None:
+        return False
+    before = _copy_ax_attribute(focused, kAXValueAttribute)
+    if before is None:
+        return False
+    err = AXUIElementSetAttributeValue(focused, kAXSelectedTextAttribute, text)
+    if err != kAXErrorSuccess:
+        return False
+    after = _copy_ax_attribute(focused, kAXValueAttribute)
+    return after is not None and after != before
+
+
 def get_selected_text() -> Optional[str]:
     """
-    Get the currently selected text by simulating Cmd+C.
+    Get the currently selected text.
+
+    Reads the selection through Accessibility when the frontmost app supports
+    it, which leaves the clipboard untouched; otherwise simulates Cmd+C.
+    Apps that fail the Accessibility read are remembered and go straight to
+    Cmd+C afterwards.
 
     Returns:
         The selected text, or None if no text was selected.
     """
+    try:
+        app = _WORKSPACE.frontmostApplication()
+        bundle_id = app.bundleIdentifier() if app is not None else None
+        if bundle_id not in _AX_UNSUPPORTED_APPS:
+            selected_text = _get_selected_text_via_ax()
+            if selected_text:
+                return selected_text
+            # "" can also mean the app doesn't report its selection, so only
+            # a failed read marks the app; either way fall back to Cmd+C.
+            # Without a bundle ID there is no app to remember
+            if selected_text is None and bundle_id is not None:
+                _AX_UNSUPPORTED_APPS.add(bundle_id)
+    except Exception as e:
+        logger.debug("Accessibility selection read failed: %s", e)
+
     try:
         # Save current clipboard content
-        pasteboard = AppKit.NSPasteboard.generalPasteboard()
-        saved_content = pasteboard.stringForType_(AppKit.NSPasteboardTypeString)
+        pasteboard = _PASTEBOARD
+        initial_count = pasteboard.changeCount()
+        saved_content = _snapshot_pasteboard(pasteboard, initial_count)
 
         # Simulate Cmd+C to copy selected text
-        source = CGEventSourceCreate(kCGEventSourceStateCombinedSessionState)
-
-        # Press Cmd
-        cmd_down = CGEventCreateKeyboardEvent(source, 0x37, True)
-        # Press C
-        c_down = CGEventCreateKeyboardEvent(source, 0x08, True)
-        # Release C
-        c_up = CGEventCreateKeyboardEvent(source, 0x08, False)
-        # Release Cmd
-        cmd_up = CGEventCreateKeyboardEvent(source, 0x37, False)
-
-        # Set flags to include Cmd
-        cmd_flags = kCGEventFlagMaskCommand
-        CGEventSetFlags(c_down, cmd_flags)
-        CGEventSetFlags(c_up, cmd_flags)
-
-        # Send events
-        CGEventPost(kCGSessionEventTap, cmd_down)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, c_down)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, c_up)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, cmd_up)
-
-        # Wait for the copy to complete
-        time.sleep(0.05)
+        _post_cmd_key(_KEY_C)
+
+        # Wait for the copy to land on the pasteboard; the poll loop uses
+        # local bindings instead of attribute lookups on every pass
+        change_count = pasteboard.changeCount
+        monotonic, sleep = time.monotonic, time.sleep
+        deadline = monotonic() + _COPY_TIMEOUT
+        while change_count() == initial_count and monotonic() < deadline:
+            sleep(0.001)
+
+        # Nothing was copied: the clipboard is untouched and still holds the
+        # previous contents, which must not be taken for the selection
+        if change_count() == initial_count:
+            logger.debug("Cmd+C did not change the clipboard")
+            return None
 
         # Get the copied text
-        selected_text = pasteboard.stringForType_(AppKit.NSPasteboardTypeString)
+        selected_text = pasteboard.stringForType_(_PBTYPE)
 
         # Restore previous clipboard content
         if saved_content:
-            pasteboard.clearContents()
-            pasteboard.setString_forType_(saved_content, AppKit.NSPasteboardTypeString)
+            _restore_pasteboard(pasteboard, saved_content)
 
         return selected_text
 
     except Exception as e:
         print(f"Error getting selected text: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
 
 def paste_text(text: str):
     """
-    Paste text to the current application by simulating Cmd+V.
+    Paste text to the current application.
+
+    Puts the text on the clipboard and simulates Cmd+V. For the apps in
+    _AX_WRITE_APPS it first writes the text straight into the focused element
+    through Accessibility, and only pastes if that inserted nothing. Call it
+    off the main thread, as the Accessibility calls go to the target app.
 
     Args:
         text: The text to paste.
     """
+    try:
+        app = _WORKSPACE.frontmostApplication()
+        bundle_id = app.bundleIdentifier() if app is not None else None
+        if bundle_id in _AX_WRITE_APPS:
+            if _replace_selection_via_ax(text):
+                return
+            # The value didn't change, so Cmd+V below can't insert twice
+            logger.debug("Accessibility write not applied in %s", bundle_id)
+    except Exception as e:
+        logger.debug("Accessibility selection write failed: %s", e)
+
     try:
         # Set clipboard content
-        pasteboard = AppKit.NSPasteboard.generalPasteboard()
-        pasteboard.clearContents()
-        pasteboard.setString_forType_(text, AppKit.NSPasteboardTypeString)
+        pasteboard = _PASTEBOARD
+        pasteboard.prepareForNewContentsWithOptions_(_PB_CURRENT_HOST_ONLY)
+        if not pasteboard.setString_forType_(text, _PBTYPE):
+            # Cmd+V would paste whatever was on the clipboard before
+            logger.warning("Could not write text to the pasteboard; not pasting")
+            return
 
         # Simulate Cmd+V to paste
-        source = CGEventSourceCreate(kCGEventSourceStateCombinedSessionState)
-
-        # Press Cmd
-        cmd_down = CGEventCreateKeyboardEvent(source, 0x37, True)
-        # Press V
-        v_down = CGEventCreateKeyboardEvent(source, 0x09, True)
-        # Release V
-        v_up = CGEventCreateKeyboardEvent(source, 0x09, False)
-        # Release Cmd
-        cmd_up = CGEventCreateKeyboardEvent(source, 0x37, False)
-
-        # Set flags to include Cmd
-        cmd_flags = kCGEventFlagMaskCommand
-        CGEventSetFlags(v_down, cmd_flags)
-        CGEventSetFlags(v_up, cmd_flags)
-
-        # Send events
-        CGEventPost(kCGSessionEventTap, cmd_down)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, v_down)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, v_up)
-        time.sleep(0.01)
-        CGEventPost(kCGSessionEventTap, cmd_up)
+        _post_cmd_key(_KEY_V)
 
     except Exception as e:
         print(f"Error pasting text: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -194,6 +383,43 @@ class MenuBarActions(AppKit.NSObject):
         if self.app:
             self.app._quit()
 
+    # Main-thread completions, posted by the worker threads through
+    # MenuBarApp._on_main (performSelectorOnMainThread)
+
+    def showLoadingBar_(self, _):
+        """Show the hotkey loading bar."""
+        if self.app:
+            self.app._loading_bar.show()
+
+    def finishRewrite_(self, _):
+        """Finish a successful hotkey rewrite."""
+        if self.app:
+            self.app._finish_rewrite()
+
+    def failRewrite_(self, message):
+        """Finish a failed hotkey rewrite."""
+        if self.app:
+            self.app._fail_rewrite(message)
+
+    def failApiKey_(self, _):
+        """Finish a hotkey rewrite that found no API key."""
+        if self.app:
+            self.app._fail_api_key()
+
+    def showApiKeyError_(self, _):
+        """Show the missing API key alert."""
+        ErrorNotifier.show_api_key_error()
+
+    def finishSpeech_(self, text):
+        """Finish a successful transcription."""
+        if self.app:
+            self.app._finish_speech(text)
+
+    def failSpeech_(self, message):
+        """Finish a failed transcription."""
+        if self.app:
+            self.app._fail_speech(message)
+
 
 class MenuBarApp:
     """Main menu bar application for Vox."""
@@ -219,17 +445,30 @@ class MenuBarApp:
         # Create loading bar for hotkey progress indication
         self._loading_bar = LoadingBarManager()
 
+        # Rewrite client for hotkeys, built on first use and reset on save
+        self._api_client: Optional[RewriteAPI] = None
+
+        # Reused daemon worker thread for hotkey rewrites and transcriptions.
+        # Both end in paste_text, so they share one worker: a transcription
+        # never pastes in the middle of a rewrite's Cmd+C and restore
+        self._worker = SerialWorker("VoxWorker")
+
         # Create hot key manager
         self._hotkey_manager = create_hotkey_manager()
         self._hotkey_manager.set_callback(self._handle_hotkey)
         self._hotkey_manager.set_enabled(self.config.hotkeys_enabled)
+        self._last_hotkey_configs = []
         self._apply_hotkey_config()
 
-        # Speech-to-text support
-        self._speech_model_manager = WhisperModelManager()
-        self._transcriber = SpeechTranscriber(self._speech_model_manager)
+        # Speech-to-text support (model manager and transcriber are created
+        # on first use)
+        self._speech_model_manager: Optional[WhisperModelManager] = None
+        self._transcriber: Optional[SpeechTranscriber] = None
         self._recording_toast = RecordingToastManager()
         self._is_speech_recording = False
+        # Guards the _is_speech_recording check-and-set together with
+        # starting/stopping the recorder
+        self._speech_lock = threading.Lock()
 
         # Register speech hotkey if enabled
         if self.config.speech_enabled:
@@ -239,14 +478,25 @@ class MenuBarApp:
         self._create_status_item()
         self._create_menu()
 
-    def _apply_hotkey_config(self):
-        """Read all mode hotkeys from config and apply to the hotkey manager."""
+    def _apply_hotkey_config(self) -> bool:
+        """
+        Apply mode hotkeys from config that changed since the last apply.
+
+        Returns:
+            True if any mode's hotkey changed.
+        """
         all_hotkeys = self.config.get_all_hotkeys()
         configs = []
         for mode in RewriteMode:
             hk = all_hotkeys.get(mode.value, {"modifiers": "", "key": ""})
             configs.append((hk["modifiers"], hk["key"], mode))
-        self._hotkey_manager.set_hotkeys(configs)
+
+        changed = set(configs).difference(self._last_hotkey_configs)
+        if not changed:
+            return False
+        self._hotkey_manager.update_hotkeys(list(changed))
+        self._last_hotkey_configs = configs
+        return True
 
     def _apply_speech_hotkey_config(self):
         """Read speech hotkey from config and apply to the hotkey manager."""
@@ -264,7 +514,7 @@ class MenuBarApp:
         icon = get_menu_bar_icon()
         if icon:
             self.status_item.button().setImage_(icon)
-            self.status_item.button().setImageScaling_(AppKit.NSImageScaleProportionallyDown)
+            self.status_item.button().setImageScaling_(AppKit.NSImageScaleNone)
         else:
             self.status_item.setTitle_("V")
 
@@ -273,15 +523,18 @@ class MenuBarApp:
         self.status_item.setMenu_(self.menu)
 
     def _create_menu(self):
-        """Create the menu items."""
-        self.menu.removeAllItems()
+        """Create the menu items.
 
+        The menu is static, so this runs once from __init__ and the items are
+        kept on the instance; change titles with setTitle_ instead of rebuilding.
+        """
         # Settings
         settings_item = AppKit.NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
             "Preferences...", "showSettings:", ","
         )
         settings_item.setTarget_(self.actions)
         self.menu.addItem_(settings_item)
+        self._settings_item = settings_item
 
         # Separator
         self.menu.addItem_(AppKit.NSMenuItem.separatorItem())
@@ -292,6 +545,7 @@ class MenuBarApp:
         )
         about_item.setTarget_(self.actions)
         self.menu.addItem_(about_item)
+        self._about_item = about_item
 
         # Separator
         self.menu.addItem_(AppKit.NSMenuItem.separatorItem())
@@ -302,10 +556,17 @@ class MenuBarApp:
         )
         quit_item.setTarget_(self.actions)
         self.menu.addItem_(quit_item)
+        self._quit_item = quit_item
 
     def _show_settings(self):
         """Show the preferences window."""
-        show_preferences_window(self._save_settings)
+        # Imported on first use: the preferences module and its NSObject
+        # subclasses aren't needed until the window is opened
+        from vox.preferences import PreferencesWindowController, show_preferences_window
+
+        show_preferences_window(
+            self._save_settings, page=PreferencesWindowController.SETTINGS_PAGE
+        )
 
     def _save_settings(self, api_key: str, model: str, base_url: Optional[str], auto_start: bool,
                       hotkeys_enabled: bool, hotkey_configs: dict,
@@ -313,138 +574,200 @@ class MenuBarApp:
                       speech_language: str = "auto", speech_hotkey: dict = None,
                       thinking_mode: bool = False):
         """Save the settings."""
-        if api_key:
-            self.config.set_api_key(api_key)
-            self.service_provider.update_api_key()
-
-        self.config.model = model
-        self.config.base_url = base_url
-        self.service_provider.update_model()
-
-        if auto_start != self.config.auto_start:
-            self.config.set_auto_start(auto_start)
-
-        self.config.thinking_mode = thinking_mode
-
-        # Update hot key settings
-        self.config.hotkeys_enabled = hotkeys_enabled
-        for mode_value, hk in hotkey_configs.items():
-            self.config.set_mode_hotkey(mode_value, hk["modifiers"], hk["key"])
-
-        # Re-register hot keys with new settings
-        self._hotkey_manager.set_enabled(hotkeys_enabled)
-        self._apply_hotkey_config()
-        if hotkeys_enabled:
-            self._hotkey_manager.reregister_hotkey()
-
-        # Update speech settings
-        self.config.speech_enabled = speech_enabled
-        self.config.speech_model = speech_model
-        self.config.speech_language = speech_language
-        if speech_hotkey:
-            self.config.set_speech_hotkey(
-                speech_hotkey["modifiers"], speech_hotkey["key"]
+        # Write config.yml once for all the changes below
+        with self.config.batch():
+            # Only touch the keychain/config file for values that actually changed
+            client_changed = False
+            if api_key and api_key != self.config.get_api_key():
+                self.config.set_api_key(api_key)
+                client_changed = True
+
+            if model != self.config.model:
+                self.config.model = model
+                client_changed = True
+
+            if base_url != self.config.base_url:
+                self.config.base_url = base_url
+                client_changed = True
+
+            # Drop the API clients once for all credential changes; both are
+            # rebuilt lazily on next use
+            if client_changed:
+                self._api_client = None
+                self.service_provider.reload()
+
+            if auto_start != self.config.auto_start:
+                self.config.set_auto_start(auto_start)
+
+            if thinking_mode != self.config.thinking_mode:
+                self.config.thinking_mode = thinking_mode
+
+            # Update hot key settings
+            enabled_changed = False
+            if hotkeys_enabled != self.config.hotkeys_enabled:
+                self.config.hotkeys_enabled = hotkeys_enabled
+                enabled_changed = True
+
+            self.config.set_all_mode_hotkeys(hotkey_configs)
+
+            # Push only the changed shortcuts to the hotkey manager. The tap
+            # reads its targets live, so an installed tap only needs
+            # re-registering when hot keys were toggled. With no tap (e.g.
+            # Accessibility was granted after launch) every Save retries
+            self._apply_hotkey_config()
+            if enabled_changed:
+                self._hotkey_manager.set_enabled(hotkeys_enabled)
+            needs_register = hotkeys_enabled and (
+                enabled_changed or not self._hotkey_manager.is_registered()
             )
 
-        # Re-register speech hotkey
-        if speech_enabled:
-            self._apply_speech_hotkey_config()
-            # Register or re-register hotkeys (works even if only speech hotkey is configured)
-            if self._hotkey_manager.is_registered():
-                self._hotkey_manager.reregister_hotkey()
-            else:
-                self._hotkey_manager.register_hotkey()
+            # Update speech settings
+            speech_changed = False
+            if speech_enabled != self.config.speech_enabled:
+                self.config.speech_enabled = speech_enabled
+                speech_changed = True
+            if speech_model != self.config.speech_model:
+                self.config.speech_model = speech_model
+            if speech_language != self.config.speech_language:
+                self.config.speech_language = speech_language
+            if speech_hotkey:
+                key = speech_hotkey["key"].lower() if speech_hotkey["key"] else ""
+                if self.config.get_speech_hotkey() != {"modifiers": speech_hotkey["modifiers"], "key": key}:
+                    self.config.set_speech_hotkey(speech_hotkey["modifiers"], key)
+                    speech_changed = True
+
+            if speech_enabled and speech_changed:
+                self._apply_speech_hotkey_config()
+                needs_register = True
+
+            # Register or re-register the tap once for both mode and speech
+            # hotkeys (works even if only the speech hotkey is configured)
+            if needs_register:
+                if self._hotkey_manager.is_registered():
+                    self._hotkey_manager.reregister_hotkey()
+                else:
+                    self._hotkey_manager.register_hotkey()
 
     def _show_about(self):
         """Show the about dialog (opens preferences on About tab)."""
-        show_preferences_window(self._save_settings)
+        from vox.preferences import PreferencesWindowController, show_preferences_window
+
+        show_preferences_window(
+            self._save_settings, page=PreferencesWindowController.ABOUT_PAGE
+        )
 
     def _quit(self):
         """Quit the application."""
+        # Drop queued rewrites/transcriptions; the worker threads are daemons,
+        # so a request in flight doesn't hold up the exit
+        self._worker.shutdown()
+        self.service_provider.shutdown()
         AppKit.NSApp.terminate_(None)
 
     def _handle_hotkey(self, mode: RewriteMode):
-        """Handle a hot key trigger for a specific mode."""
-        print(f"Hot key triggered for mode: {mode.value}")
+        """
+        Handle a hot key trigger for a specific mode.
+
+        Called on the main thread; it only submits the mode to the worker.
+        The API key check, copying the selection, the API call and the paste
+        all run on a worker thread so the main run loop never blocks on them.
+        """
+        logger.debug("Hot key triggered for mode: %s", mode.value)
 
+        self._worker.submit(self._run_hotkey, mode)
+
+    def _run_hotkey(self, mode: RewriteMode):
+        """Copy the selection and rewrite it (runs on the worker)."""
+        # The worker thread has no autorelease pool of its own; drain the
+        # pasteboard/event objects created for this rewrite when it finishes
+        with objc.autorelease_pool():
+            self._rewrite_selection(mode)
+
+    def _rewrite_selection(self, mode: RewriteMode):
+        """Body of _run_hotkey."""
         try:
-            # Check if API key is configured
-            api_key = self.config.get_api_key()
-            if not api_key:
-                ErrorNotifier.show_api_key_error()
-                return
+            # Check if API key is configured (not needed once a client exists)
+            api_key = None
+            if self._api_client is None:
+                api_key = self.config.get_api_key()
+                if not api_key:
+                    self._on_main("showApiKeyError:")
+                    return
 
             # Get selected text
             text = get_selected_text()
             if not text or not text.strip():
-                print("No text selected")
+                logger.debug("No text selected")
                 return
 
-            print(f"Selected text: {text!r}")
+            logger.debug("Selected text: %r", text)
 
             # Process directly — no popup needed
-            self._process_text_directly(text, mode)
+            self._process_text_directly(text, mode, api_key=api_key)
 
         except Exception as e:
             print(f"Error handling hot key: {e}")
-            import traceback
             traceback.print_exc()
 
-    def _process_text_directly(self, text: str, mode: RewriteMode):
+    def _process_text_directly(self, text: str, mode: RewriteMode,
+                               api_key: Optional[str] = None):
         """
         Process text with the given mode directly (no dialog).
 
-        The API call runs on a background thread so the main-thread run loop
-        stays free and Core Animation can render the loading-bar shimmer.
+        Called on the worker thread, which also performs the paste. Only
+        the loading bar and error alerts are dispatched to the main thread,
+        so Core Animation keeps rendering the shimmer meanwhile.
 
         Args:
             text: The text to rewrite.
             mode: The rewrite mode to use.
+            api_key: Key already read by the caller; fetched from config if None.
         """
-        api_key = self.config.get_api_key()
-        if not api_key:
-            ErrorNotifier.show_api_key_error()
-            return
-
-        api_client = RewriteAPI(api_key, self.config.model, self.config.base_url)
+        # Show loading bar at top of screen (main thread) right away, so the
+        # window is built while this thread reads the key and sets up the client
+        self._on_main("showLoadingBar:")
+
+        # Reuse the client (and its HTTP connection pool) across rewrites
+        api_client = self._api_client
+        if api_client is None:
+            if api_key is None:
+                api_key = self.config.get_api_key()
+            if not api_key:
+                self._on_main("failApiKey:")
+                return
+            api_client = RewriteAPI(api_key, self.config.model, self.config.base_url)
+            self._api_client = api_client
         thinking_mode = self.config.thinking_mode
 
-        # Show loading bar at top of screen (main thread)
-        self._loading_bar.show()
+        try:
+            result = api_client.rewrite(text, mode, thinking_mode)
+            logger.debug("Rewritten text: %r", result)
 
-        def _do_rewrite():
-            try:
-                result = api_client.rewrite(text, mode, thinking_mode)
-                print(f"Rewritten text: {result!r}")
+            paste_text(result)
 
-                # Dispatch paste + hide back to the main thread
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda: self._finish_rewrite(result)
-                )
-            except (APIKeyError, NetworkError, RateLimitError, RewriteError) as exc:
-                msg = str(exc)
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda: self._fail_rewrite(msg)
-                )
-            except Exception as exc:
-                print(f"Error processing text: {exc}")
-                import traceback
-                traceback.print_exc()
-                msg = f"Error: {exc}"
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda: self._fail_rewrite(msg)
-                )
+            # Dispatch the hide back to the main thread
+            self._on_main("finishRewrite:")
+        except (APIKeyError, NetworkError, RateLimitError, RewriteError) as exc:
+            self._on_main("failRewrite:", str(exc))
+        except Exception as exc:
+            print(f"Error processing text: {exc}")
+            traceback.print_exc()
+            self._on_main("failRewrite:", f"Error: {exc}")
 
-        threading.Thread(target=_do_rewrite, name="VoxRewrite", daemon=True).start()
+    def _on_main(self, selector: str, obj=None):
+        """Run a MenuBarActions selector on the main thread without waiting."""
+        self.actions.performSelectorOnMainThread_withObject_waitUntilDone_(
+            selector, obj, False
+        )
 
-    def _finish_rewrite(self, result: str):
-        """Called on the main thread after a successful rewrite."""
-        pasteboard = AppKit.NSPasteboard.generalPasteboard()
-        pasteboard.clearContents()
-        pasteboard.setString_forType_(result, AppKit.NSPasteboardTypeString)
+    def _finish_rewrite(self):
+        """Called on the main thread after the rewritten text was pasted."""
+        self._loading_bar.hide()
 
-        paste_text(result)
+    def _fail_api_key(self):
+        """Called on the main thread when no API key is configured."""
         self._loading_bar.hide()
+        ErrorNotifier.show_api_key_error()
 
     def _fail_rewrite(self, message: str):
         """Called on the main thread after a failed rewrite."""
@@ -465,20 +788,32 @@ class MenuBarApp:
                 self._stop_and_transcribe()
         except Exception as e:
             print(f"Error in _handle_speech_hotkey: {e}", flush=True)
-            import traceback
             traceback.print_exc()
-            # Reset recording state on error
-            self._is_speech_recording = False
-            # Cancel the transcriber recording state
-            try:
-                self._transcriber.cancel_recording()
-            except Exception:
-                pass
+            # Reset recording state on error and cancel the transcriber
+            with self._speech_lock:
+                self._is_speech_recording = False
+                try:
+                    if self._transcriber is not None:
+                        self._transcriber.cancel_recording()
+                except Exception:
+                    pass
             try:
                 self._recording_toast.hide()
             except Exception:
                 pass
 
+    def _get_speech_model_manager(self) -> WhisperModelManager:
+        """Get the Whisper model manager, creating it on first use."""
+        if self._speech_model_manager is None:
+            self._speech_model_manager = WhisperModelManager()
+        return self._speech_model_manager
+
+    def _get_transcriber(self) -> SpeechTranscriber:
+        """Get the speech transcriber, creating it on first use."""
+        if self._transcriber is None:
+            self._transcriber = SpeechTranscriber(self._get_speech_model_manager())
+        return self._transcriber
+
     def _start_speech_recording(self):
         """Start recording audio for speech-to-text."""
         if self._is_speech_recording:
@@ -490,26 +825,29 @@ class MenuBarApp:
         # Check microphone permission and request if needed
         if not AudioRecorder.has_microphone_permission():
             # Request permission - this shows the system dialog
-            def on_permission_result(granted: bool):
-                if granted:
-                    # Permission granted, continue with recording
-                    self._continue_start_recording()
-                else:
-                    # Permission denied, hide toast and show dialog
-                    self._recording_toast.hide()
-                    self._show_microphone_permission_dialog()
-
-            AudioRecorder.request_microphone_permission(on_permission_result)
+            AudioRecorder.request_microphone_permission(
+                self._on_microphone_permission_result
+            )
             return
 
         # Already have permission, continue
         self._continue_start_recording()
 
+    def _on_microphone_permission_result(self, granted: bool):
+        """Called with the result of the microphone permission request."""
+        if granted:
+            # Permission granted, continue with recording
+            self._continue_start_recording()
+        else:
+            # Permission denied, hide toast and show dialog
+            self._recording_toast.hide()
+            self._show_microphone_permission_dialog()
+
     def _continue_start_recording(self):
         """Continue starting recording after permission check."""
         # Check if model is downloaded
         model_name = self.config.speech_model
-        if not self._speech_model_manager.is_model_downloaded(model_name):
+        if not self._get_speech_model_manager().is_model_downloaded(model_name):
             self._recording_toast.hide()
             ErrorNotifier.show_error(
                 "Vox - Model Not Downloaded",
@@ -517,76 +855,80 @@ class MenuBarApp:
             )
             return
 
-        try:
-            # Start recording with level callback (use default sample rate)
-            self._transcriber.start_recording(
-                
-                level_callback=self._recording_toast.update_level
-                
-            )
-            self._is_speech_recording = True
-            print("Speech recording started", flush=True)
+        # Check-and-set the flag together with starting the recorder; error
+        # UI is shown after the lock is released
+        error = None
+        with self._speech_lock:
+            if self._is_speech_recording:
+                return
+            try:
+                # Start recording with level callback (use default sample rate)
+                self._get_transcriber().start_recording(
+                    level_callback=self._recording_toast.update_level
+                )
+                self._is_speech_recording = True
+            except SpeechError as e:
+                error = e
 
-        except MicrophonePermissionError:
+        if error is None:
+            logger.debug("Speech recording started")
+        elif isinstance(error, MicrophonePermissionError):
             self._recording_toast.hide()
             self._show_microphone_permission_dialog()
-        except SpeechError as e:
+        else:
             self._recording_toast.hide()
-            ErrorNotifier.show_generic_error(str(e))
+            ErrorNotifier.show_generic_error(str(error))
 
     def _stop_and_transcribe(self):
         """Stop recording and transcribe the audio."""
-        if not self._is_speech_recording:
-            return
+        with self._speech_lock:
+            if not self._is_speech_recording:
+                return
+            self._is_speech_recording = False
 
-        self._is_speech_recording = False
         self._recording_toast.show_transcribing()
 
         model_name = self.config.speech_model
         language = self.config.speech_language
 
         # Check if still recording before transcription
-        if not self._transcriber.is_recording():
-            print("Recording was cancelled, skipping transcription", flush=True)
+        if not self._get_transcriber().is_recording():
+            logger.debug("Recording was cancelled, skipping transcription")
             self._recording_toast.hide()
             return
 
-        def _do_transcribe():
+        self._worker.submit(self._transcribe, model_name, language)
+
+    def _transcribe(self, model_name: str, language: str):
+        """Transcribe the recorded audio (runs on the worker)."""
+        with objc.autorelease_pool():
             try:
-                text = self._transcriber.stop_and_transcribe(
+                text = self._get_transcriber().stop_and_transcribe(
                     model_name, language
                 )
 
+                # Paste here rather than on the main thread: the
+                # Accessibility write and Cmd+V go to another app
+                if text:
+                    logger.debug("Transcribed: %r", text)
+                    paste_text(text)
+
                 # Dispatch result to main thread
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda: self._finish_speech(text)
-                )
+                self._on_main("finishSpeech:", text)
             except ModelNotDownloadedError:
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda: self._fail_speech(f"Model '{model_name}' not downloaded")
-                )
+                self._on_main("failSpeech:", f"Model '{model_name}' not downloaded")
             except SpeechError as speech_err:
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda err=speech_err: self._fail_speech(str(err))
-                )
+                self._on_main("failSpeech:", str(speech_err))
             except Exception as exc_err:
                 print(f"Transcription error: {exc_err}")
-                import traceback
                 traceback.print_exc()
-                AppKit.NSOperationQueue.mainQueue().addOperationWithBlock_(
-                    lambda err=exc_err: self._fail_speech(f"Transcription failed: {err}")
-                )
-
-        threading.Thread(target=_do_transcribe, name="VoxSpeech", daemon=True).start()
+                self._on_main("failSpeech:", f"Transcription failed: {exc_err}")
 
     def _finish_speech(self, text: Optional[str]):
-        """Called on the main thread after successful transcription."""
+        """Called on the main thread after transcription; text was already pasted."""
         self._recording_toast.hide()
 
-        if text:
-            print(f"Transcribed: {text!r}", flush=True)
-            paste_text(text)
-        else:
+        if not text:
             # No speech detected
             ErrorNotifier.show_error(
                 "Vox",
@@ -618,7 +960,7 @@ class MenuBarApp:
         response = alert.runModal()
 
         if response == AppKit.NSAlertFirstButtonReturn:
-            AppKit.NSWorkspace.sharedWorkspace().openURL_(
+            _WORKSPACE.openURL_(
                 AppKit.NSURL.URLWithString_(
                     "x-apple.systempreferences:com.apple.preference.security?Privacy_Microphone"
                 )
@@ -0,0 +1,79 @@
+"""
+Background worker thread for Vox.
+
+Provides SerialWorker, a single persistent daemon thread that runs
+submitted calls one at a time, in submission order.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class SerialWorker:
+    """Runs submitted calls in order on one long-lived daemon thread.
+
+    Unlike ThreadPoolExecutor workers, the thread is a daemon, so an
+    in-flight API request can't hold up interpreter exit (SIGTERM, Ctrl-C
+    or NSApp.terminate_).
+    """
+
+    def __init__(self, name: str):
+        """
+        Start the worker thread.
+
+        Args:
+            name: Thread name, shown in crash reports and debuggers.
+        """
+        self._queue = queue.Queue()
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args) -> Future:
+        """
+        Queue func(*args) to run on the worker thread.
+
+        Returns:
+            Future holding the call's result or exception.
+
+        Raises:
+            RuntimeError: If the worker was shut down.
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            future = Future()
+            self._queue.put((future, func, args))
+        return future
+
+    def shutdown(self):
+        """Cancel queued calls and stop the thread after the current call."""
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                item[0].cancel()
+            # Wakes the thread so it can exit
+            self._queue.put(None)
+
+    def _run(self):
+        """Worker thread loop."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)